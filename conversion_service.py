@@ -1,12 +1,21 @@
 import os
 import shutil
+import subprocess
 import asyncio
 import threading
 from typing import Optional, Dict, Any
-from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict, deque, OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
 import logging
 import io
 import re
+import textwrap
+import atexit
+import socket
+import time
 
 # Document processing
 from PyPDF2 import PdfReader, PdfWriter
@@ -24,6 +33,12 @@ import xml.etree.ElementTree as ET
 import json
 import csv
 
+# Faster JSON encode/decode (optional - falls back to the stdlib json module)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Image processing
 from PIL import Image, ImageDraw, ImageFont
 import cv2
@@ -32,15 +47,31 @@ from cairosvg import svg2png, svg2pdf
 from svglib.svglib import svg2rlg
 from reportlab.graphics import renderPDF, renderPM
 
-# Audio/Video processing (optional - commented out to avoid import errors)
-# from pydub import AudioSegment
-# from moviepy.editor import VideoFileClip, AudioFileClip
+# Audio/Video processing (optional - the converters fall back to ffmpeg)
+try:
+    from pydub import AudioSegment
+except ImportError:
+    AudioSegment = None
+try:
+    from moviepy.editor import VideoFileClip, AudioFileClip
+except ImportError:
+    VideoFileClip = AudioFileClip = None
 # import imageio
 
 # E-book processing (optional - commented out to avoid import errors)
 # import ebooklib
 # from ebooklib import epub
 
+# Pandoc and PyMuPDF (optional - converters that need them fall back or fail gracefully)
+try:
+    import pypandoc
+except ImportError:
+    pypandoc = None
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
 # Presentation processing
 from pptx import Presentation
 from pptx.util import Inches as PptxInches
@@ -53,9 +84,184 @@ import tempfile
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Minimum progress change (percentage points) published from per-item conversion loops
+PROGRESS_STEP = 5
+
+# Maximum number of parsed HTML/XML documents kept in memory for reuse, and the total size of their
+# source files (a parsed tree takes several times its file's size). Larger files are never cached.
+PARSE_CACHE_SIZE = 32
+PARSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+PARSE_CACHE_MAX_FILE_BYTES = 2 * 1024 * 1024
+
+# ffprobe results kept for reuse (media files are far above the parse cache's file size limit)
+PROBE_CACHE_SIZE = 64
+
+# Rows per table when rendering CSV to PDF
+CSV_PDF_CHUNK_ROWS = 500
+
+# Rows read per chunk when streaming CSV to JSON
+CSV_JSON_CHUNK_ROWS = 10000
+
+# Pipe buffer size for external converters (ffmpeg, soffice, ebook-convert, ...)
+SUBPROC_BUFSIZE = 1 << 20
+
+# Bytes of ffmpeg's stderr kept for error messages; the rest of its log is discarded
+FFMPEG_STDERR_TAIL = 64 * 1024
+
+# ffmpeg codec/bitrate arguments per output format (formats not listed use ffmpeg's defaults)
+AUDIO_FFMPEG_ARGS = {
+    'mp3': ('-acodec', 'libmp3lame', '-ab', '192k'),
+    'wav': ('-acodec', 'pcm_s16le'),
+    'aac': ('-acodec', 'aac', '-ab', '192k'),
+    'flac': ('-acodec', 'flac'),
+    'ogg': ('-acodec', 'libvorbis', '-ab', '192k'),
+    'm4a': ('-acodec', 'aac', '-ab', '192k'),
+}
+VIDEO_FFMPEG_ARGS = {
+    'mp4': ('-c:v', 'libx264', '-c:a', 'aac', '-b:a', '192k'),
+    'avi': ('-c:v', 'libxvid', '-c:a', 'mp3', '-b:a', '192k'),
+    'mov': ('-c:v', 'libx264', '-c:a', 'aac', '-b:a', '192k'),
+    'webm': ('-c:v', 'libvpx', '-c:a', 'libvorbis', '-b:a', '192k'),
+    'mkv': ('-c:v', 'libx264', '-c:a', 'aac', '-b:a', '192k'),
+    'wmv': ('-c:v', 'wmv2', '-c:a', 'wmav2'),
+    'flv': ('-c:v', 'flv', '-c:a', 'mp3', '-b:a', '192k'),
+}
+V2A_FFMPEG_ARGS = {
+    'mp3': ('-vn', '-acodec', 'libmp3lame', '-ab', '192k'),
+    'wav': ('-vn', '-acodec', 'pcm_s16le'),
+    'aac': ('-vn', '-acodec', 'aac', '-ab', '192k'),
+    'flac': ('-vn', '-acodec', 'flac'),
+    'ogg': ('-vn', '-acodec', 'libvorbis', '-ab', '192k'),
+}
+
+# Codecs each output container can take as-is, so ffmpeg can remux with -c copy instead of re-encoding
+STREAM_COPY_CODECS = {
+    'mp3': {'mp3'},
+    'aac': {'aac'},
+    'm4a': {'aac', 'alac'},
+    'flac': {'flac'},
+    'ogg': {'vorbis', 'opus', 'flac'},
+    'wav': {'pcm_s16le', 'pcm_s24le', 'pcm_f32le'},
+    'mp4': {'h264', 'hevc', 'av1', 'aac', 'mp3'},
+    'mov': {'h264', 'hevc', 'prores', 'aac', 'mp3', 'alac'},
+    'mkv': {'h264', 'hevc', 'vp8', 'vp9', 'av1', 'aac', 'mp3', 'opus', 'vorbis', 'flac'},
+    'webm': {'vp8', 'vp9', 'av1', 'opus', 'vorbis'},
+}
+
+# ioctl request for a copy-on-write clone of a whole file (linux/fs.h)
+FICLONE = 0x40049409
+
+# Intermediate files of chained conversions are kept on tmpfs when it exists
+INTERMEDIATE_DIR = "/dev/shm"
+
+# Long-running LibreOffice instance (unoserver) used instead of spawning soffice per file
+OFFICE_SERVER_HOST = "127.0.0.1"
+OFFICE_SERVER_PORT = 2003
+OFFICE_SERVER_STARTUP_TIMEOUT = 30
+# Source formats whose converters go through that instance
+OFFICE_SOURCE_FORMATS = frozenset({"DOC", "DOCX", "XLS", "XLSX", "PPT", "PPTX"})
+
+# Precompiled patterns for the plain-text HTML fallback (operate on raw bytes)
+_TAG_RE = re.compile(rb'<[^>]+>')
+_WS_RE = re.compile(rb'\s+')
+# Newline plus surrounding whitespace, for splitting extracted text into stripped lines
+_LINE_SPLIT_RE = re.compile(r'\s*\n\s*')
+
+# Image to HTML page, split around the base64 payload of the embedded image
+IMAGE_HTML_PROLOGUE = b'''<!DOCTYPE html>
+<html>
+<head>
+    <title>Image Conversion</title>
+    <style>
+        body { margin: 20px; font-family: Arial, sans-serif; }
+        .image-container { text-align: center; }
+        img { max-width: 100%; height: auto; }
+    </style>
+</head>
+<body>
+    <div class="image-container">
+        <img src="data:image/png;base64,'''
+IMAGE_HTML_EPILOGUE = b'''" alt="Converted Image">
+    </div>
+</body>
+</html>'''
+
+# Bytes read per base64 chunk (a multiple of 3, so chunks encode without padding)
+BASE64_CHUNK_BYTES = 3 * 64 * 1024
+
+# Rasterized PDF pages with at least this much text stay lossless (PNG); the rest are stored as JPEG
+PDF_TEXT_PAGE_MIN_CHARS = 200
+PDF_JPEG_QUALITY = 85
+
+def _rasterize_pdf_page(page) -> bytes:
+    """Render a PyMuPDF page without alpha: PNG bytes for text-heavy pages, JPEG otherwise"""
+    pix = page.get_pixmap(alpha=False)
+    if len(page.get_text()) >= PDF_TEXT_PAGE_MIN_CHARS:
+        return pix.tobytes("png")
+    return pix.tobytes("jpeg", jpg_quality=PDF_JPEG_QUALITY)
+
+def _pool_mp_context():
+    """forkserver where available (Unix), else spawn; never fork a threaded process"""
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+# ConversionService of the current conversion worker process, created on its first job
+_worker_service = None
+# Queue to the API process for progress updates, and (host, port) of the LibreOffice instance the API
+# process runs; set by the pool initializer in each worker
+_progress_queue = None
+_office_address = None
+
+def _init_conversion_worker(progress_queue, office_address):
+    global _progress_queue, _office_address
+    _progress_queue = progress_queue
+    _office_address = office_address
+
+class _ProgressRelayJob(dict):
+    """A worker's local job dict that also sends each progress write to the API process"""
+    def __init__(self, job_id: str, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.job_id = job_id
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        if key == "progress" and _progress_queue is not None:
+            _progress_queue.put((self.job_id, value))
+
+def _convert_in_worker(source_format: str, destination_format: str, input_path: str, output_path: str, job_id: str):
+    """Run one converter in a conversion worker process.
+
+    Converters record progress, warnings, the method used, etc. on their job; here that is a local
+    job dict, returned with the result so the parent can copy the fields onto the real job. Progress
+    is also relayed as it changes (see ConversionService._relay_progress).
+    """
+    global _worker_service
+    if _worker_service is None:
+        _worker_service = ConversionService()
+    job = _ProgressRelayJob(job_id)
+    converter_method = _worker_service._get_converter_method(source_format, destination_format)
+    success = converter_method(input_path, output_path, job_id, {job_id: job})
+    return success, dict(job)
+
 class ConversionService:
-    def __init__(self):
-        self.executor = ThreadPoolExecutor(max_workers=4)
+    def __init__(self, max_workers: Optional[int] = None):
+        # Worker processes the converters run in (own GIL each; a crashing converter can't take the API down), created on first use
+        self.process_pool = None
+        self._max_workers = max_workers or os.cpu_count()
+        # Progress updates from the workers, and the jobs dict of each job running there (by job ID)
+        self._progress_queue = None
+        self._progress_targets = {}
+        # LRU of parsed HTML/XML keyed by file identity, shared across jobs
+        self._parse_cache: OrderedDict = OrderedDict()
+        self._parse_cache_bytes = 0
+        self._parse_cache_lock = threading.Lock()
+        # LRU of ffprobe codec results keyed by file identity
+        self._probe_cache: OrderedDict = OrderedDict()
+        self._probe_cache_lock = threading.Lock()
+        # Shared LibreOffice process, started by the API process on the first office job
+        self._office_proc = None
+        self._office_lock = threading.Lock()
+        atexit.register(self._stop_office_server)
     
     async def convert_file(self, input_path: str, output_path: str, source_format: str, destination_format: str, job_id: str, jobs: Dict) -> bool:
         """Main conversion method that routes to specific converters"""
@@ -69,16 +275,46 @@ class ConversionService:
             if not converter_method:
                 raise ValueError(f"Conversion from {source_format} to {destination_format} not supported")
             
-            # Run conversion in thread pool
-            loop = asyncio.get_event_loop()
-            success = await loop.run_in_executor(
-                self.executor, 
-                converter_method, 
-                input_path, 
-                output_path, 
-                job_id, 
-                jobs
-            )
+            # Run conversion in a worker process; it returns once the output is fully written
+            if self.process_pool is None:
+                # Not forked: by now the API process has threads (asyncio.to_thread, the progress relay) running
+                mp_context = _pool_mp_context()
+                if self._progress_queue is None:
+                    self._progress_queue = mp_context.Queue()
+                    threading.Thread(target=self._relay_progress, daemon=True).start()
+                self.process_pool = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=mp_context,
+                    initializer=_init_conversion_worker,
+                    initargs=(self._progress_queue, (OFFICE_SERVER_HOST, OFFICE_SERVER_PORT))
+                )
+            pool = self.process_pool
+            if source_format in OFFICE_SOURCE_FORMATS:
+                await asyncio.to_thread(self._start_office_server)
+            loop = asyncio.get_running_loop()
+            self._progress_targets[job_id] = (loop, jobs)
+            try:
+                success, job_fields = await loop.run_in_executor(
+                    pool,
+                    _convert_in_worker,
+                    source_format,
+                    destination_format,
+                    input_path,
+                    output_path,
+                    job_id
+                )
+            except BrokenProcessPool:
+                # A worker died mid-conversion; later jobs get a fresh pool (unless another job already made one)
+                if self.process_pool is pool:
+                    self.process_pool = None
+                    pool.shutdown(wait=False)
+                raise
+            finally:
+                self._progress_targets.pop(job_id, None)
+            
+            # Progress was relayed while the job ran; copy over the rest of what the converter recorded
+            job_fields.pop("progress", None)
+            jobs[job_id].update(job_fields)
             
             if success:
                 jobs[job_id]["status"] = "completed"
@@ -96,6 +332,20 @@ class ConversionService:
             jobs[job_id]["error"] = str(e)
             return False
     
+    def _relay_progress(self):
+        """Copy progress sent by conversion workers onto the jobs (runs in a daemon thread)"""
+        while True:
+            job_id, progress = self._progress_queue.get()
+            target = self._progress_targets.get(job_id)
+            if target is not None:
+                loop, jobs = target
+                loop.call_soon_threadsafe(self._apply_progress, job_id, jobs, progress)
+    
+    def _apply_progress(self, job_id: str, jobs: Dict, progress: int):
+        # Runs on the event loop; updates arriving after the job finished are dropped
+        if job_id in self._progress_targets and job_id in jobs:
+            jobs[job_id]["progress"] = progress
+    
     def _get_converter_method(self, source: str, destination: str):
         """Get the appropriate converter method"""
         converter_map = {
@@ -279,6 +529,256 @@ class ConversionService:
         
         return converter_map.get((source.upper(), destination.upper()))
     
+    def _set_loop_progress(self, jobs: Dict, job_id: str, start: int, index: int, total: int, span: int = 60) -> None:
+        """Progress for item index of total, mapped onto [start, start + span].
+
+        Only published once it has moved by PROGRESS_STEP, so per-page/per-row loops don't write the job on every item.
+        """
+        value = start + (index / max(total, 1)) * span
+        if value - jobs[job_id].get("progress", 0) >= PROGRESS_STEP:
+            jobs[job_id]["progress"] = value
+    
+    def _write_output(self, output_path: str, buffer: io.BytesIO) -> None:
+        """Write a document rendered into memory to disk, without copying the buffer"""
+        with open(output_path, 'wb') as f:
+            f.write(buffer.getbuffer())
+    
+    def _run_command(self, cmd: list, timeout: int):
+        """Equivalent of subprocess.run(cmd, capture_output=True, text=True) with 1 MiB pipe buffers"""
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=SUBPROC_BUFSIZE)
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+        return subprocess.CompletedProcess(
+            cmd, proc.returncode, stdout.decode('utf-8', 'replace'), stderr.decode('utf-8', 'replace')
+        )
+    
+    def _fast_copy(self, src: str, dst: str) -> None:
+        """Copy src to dst inside the kernel, preserving metadata like shutil.copy2.
+
+        Tries a copy-on-write reflink (FICLONE) first, then copy_file_range, then sendfile.
+        """
+        import errno
+        
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+                remaining = os.fstat(in_fd).st_size
+                try:
+                    import fcntl
+                    # Clone the extents on Btrfs/XFS/etc. - O(1) regardless of file size
+                    fcntl.ioctl(out_fd, FICLONE, in_fd)
+                    remaining = 0
+                except (ImportError, OSError):
+                    pass
+                use_copy_file_range = hasattr(os, 'copy_file_range')
+                while remaining > 0:
+                    if use_copy_file_range:
+                        try:
+                            sent = os.copy_file_range(in_fd, out_fd, remaining)
+                        except OSError as e:
+                            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                                raise
+                            use_copy_file_range = False
+                            continue
+                    else:
+                        sent = os.sendfile(out_fd, in_fd, None, remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+        except (OSError, AttributeError) as e:
+            logger.warning(f"Kernel copy failed, falling back to shutil.copyfile: {e}")
+            shutil.copyfile(src, dst)
+        shutil.copystat(src, dst)
+    
+    def _prefetch(self, path: str) -> None:
+        """Ask the kernel to start reading a file into the page cache (Linux; no-op elsewhere)"""
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        try:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.debug(f"Prefetch hint failed for {path}: {e}")
+    
+    @contextmanager
+    def _intermediate_path(self, suffix: str):
+        """Path for an intermediate file of a chained conversion, removed afterwards.
+
+        Intermediates go to /dev/shm (tmpfs) when available so they never hit the disk.
+        """
+        temp_dir = INTERMEDIATE_DIR if os.path.isdir(INTERMEDIATE_DIR) else None
+        fd, path = tempfile.mkstemp(suffix=suffix, prefix='conv_', dir=temp_dir)
+        os.close(fd)
+        try:
+            yield path
+        finally:
+            # The parse cache would otherwise hold the removed file's tree until LRU pushes it out
+            self._evict_parsed(path)
+            if os.path.exists(path):
+                os.remove(path)
+    
+    def _cached_parse(self, path: str, kind: str, parse) -> Any:
+        """Return parse(path), reusing an earlier result while the file is unchanged.
+
+        Cached documents are shared between jobs, so callers must not modify them.
+        """
+        stat = os.stat(path)
+        key = (kind, os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+        with self._parse_cache_lock:
+            if key in self._parse_cache:
+                self._parse_cache.move_to_end(key)
+                return self._parse_cache[key]
+        
+        parsed = parse(path)
+        if stat.st_size > PARSE_CACHE_MAX_FILE_BYTES:
+            return parsed
+        
+        with self._parse_cache_lock:
+            if key not in self._parse_cache:
+                self._parse_cache_bytes += stat.st_size
+            self._parse_cache[key] = parsed
+            while len(self._parse_cache) > PARSE_CACHE_SIZE or self._parse_cache_bytes > PARSE_CACHE_MAX_BYTES:
+                evicted_key, _ = self._parse_cache.popitem(last=False)
+                self._parse_cache_bytes -= evicted_key[3]
+        return parsed
+    
+    def _evict_parsed(self, path: str) -> None:
+        """Drop every cached parse of a file"""
+        path = os.path.abspath(path)
+        with self._parse_cache_lock:
+            for key in [key for key in self._parse_cache if key[1] == path]:
+                del self._parse_cache[key]
+                self._parse_cache_bytes -= key[3]
+    
+    def _get_soup(self, path: str) -> BeautifulSoup:
+        """Parsed (read-only) BeautifulSoup document for an HTML file"""
+        def parse(html_path):
+            # Hand bs4 raw bytes with a known encoding so it skips encoding detection
+            with open(html_path, 'rb') as f:
+                return BeautifulSoup(f.read(), 'lxml', from_encoding='utf-8')
+        return self._cached_parse(path, "soup", parse)
+    
+    def _get_html_text(self, path: str) -> str:
+        """Text content of an HTML file, extracted with lxml's C parser (BeautifulSoup as fallback)"""
+        def extract(html_path):
+            import lxml.html
+            with open(html_path, 'rb') as f:
+                data = f.read()
+            try:
+                doc = lxml.html.document_fromstring(data)
+                # Like BeautifulSoup's get_text(), leave out scripts and stylesheets
+                for element in doc.xpath('//script|//style'):
+                    element.drop_tree()
+                return doc.text_content()
+            except Exception as e:
+                logger.warning(f"lxml HTML text extraction failed, using BeautifulSoup: {e}")
+                return self._get_soup(html_path).get_text()
+        return self._cached_parse(path, "html_text", extract)
+    
+    def _iter_html_lines(self, path: str):
+        """Yield the stripped, non-empty text lines of an HTML file"""
+        # Splitting on the whitespace around newlines leaves the lines already stripped
+        for line in _LINE_SPLIT_RE.split(self._get_html_text(path).strip()):
+            if line:
+                yield line
+    
+    def _iter_text_lines(self, soup: BeautifulSoup):
+        """Yield the lines of soup.get_text() in one pass, without building the full text"""
+        pending = []
+        for string in soup.strings:
+            parts = string.split('\n')
+            pending.append(parts[0])
+            for part in parts[1:]:
+                yield ''.join(pending)
+                pending = [part]
+        yield ''.join(pending)
+    
+    def _get_pptx(self, path: str) -> Presentation:
+        """Parsed (read-only) python-pptx Presentation for a PPTX file"""
+        return self._cached_parse(path, "pptx", Presentation)
+    
+    def _get_slide_texts(self, path: str) -> list:
+        """Non-empty shape texts of each slide, extracted once per PPTX file"""
+        def extract(pptx_path):
+            return [
+                [shape.text for shape in slide.shapes if getattr(shape, "text", None)]
+                for slide in self._get_pptx(pptx_path).slides
+            ]
+        return self._cached_parse(path, "pptx_text", extract)
+    
+    def _office_convert(self, input_path: str, output_path: str, convert_to: str) -> None:
+        """Convert a document through the shared LibreOffice instance (run by the API process)"""
+        from unoserver.client import UnoClient
+        if _office_address is None:
+            raise RuntimeError("No shared LibreOffice instance in this process")
+        host, port = _office_address
+        UnoClient(host, str(port)).convert(inpath=input_path, outpath=output_path, convert_to=convert_to)
+    
+    def _start_office_server(self) -> None:
+        """Start the shared LibreOffice instance if it isn't running; converters fall back to soffice if this fails"""
+        try:
+            self._ensure_office_server()
+        except Exception as e:
+            logger.warning(f"Shared LibreOffice instance could not be started: {e}")
+    
+    def _ensure_office_server(self) -> None:
+        with self._office_lock:
+            if self._office_proc is not None and self._office_proc.poll() is None:
+                return
+            # Another API worker process may already be serving on the port
+            if self._office_server_reachable():
+                return
+            self._office_proc = subprocess.Popen(
+                ['unoserver', '--interface', OFFICE_SERVER_HOST, '--port', str(OFFICE_SERVER_PORT)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            
+            # Wait until the XML-RPC endpoint accepts connections
+            deadline = time.monotonic() + OFFICE_SERVER_STARTUP_TIMEOUT
+            while True:
+                if self._office_proc.poll() is not None:
+                    # Another API worker process started its server first and holds the port
+                    if self._office_server_reachable():
+                        self._office_proc = None
+                        return
+                    raise RuntimeError(f"unoserver exited with code {self._office_proc.returncode}")
+                if self._office_server_reachable():
+                    return
+                if time.monotonic() > deadline:
+                    self._office_proc.terminate()
+                    raise RuntimeError("unoserver did not start in time")
+                time.sleep(0.25)
+    
+    def _office_server_reachable(self) -> bool:
+        """Whether something accepts connections on the unoserver port"""
+        try:
+            socket.create_connection((OFFICE_SERVER_HOST, OFFICE_SERVER_PORT), timeout=1).close()
+            return True
+        except OSError:
+            return False
+    
+    def _stop_office_server(self) -> None:
+        proc = self._office_proc
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=10)
+            except Exception:
+                proc.kill()
+    
+    def _get_xml_tree(self, path: str):
+        """Parsed (read-only) lxml tree for an XML file"""
+        from lxml import etree
+        return self._cached_parse(path, "lxml", etree.parse)
+    
     # PDF Conversion Methods
     def _pdf_to_docx(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
@@ -286,7 +786,7 @@ class ConversionService:
             doc = Document()
             
             for page_num, page in enumerate(reader.pages):
-                jobs[job_id]["progress"] = 20 + (page_num / len(reader.pages)) * 60
+                self._set_loop_progress(jobs, job_id, 20, page_num, len(reader.pages))
                 text = page.extract_text()
                 doc.add_paragraph(text)
                 if page_num < len(reader.pages) - 1:
@@ -308,7 +808,7 @@ class ConversionService:
             text_content = ""
             
             for page_num, page in enumerate(reader.pages):
-                jobs[job_id]["progress"] = 20 + (page_num / len(reader.pages)) * 60
+                self._set_loop_progress(jobs, job_id, 20, page_num, len(reader.pages))
                 text_content += page.extract_text() + "\n\n"
             
             with open(output_path, 'w', encoding='utf-8') as f:
@@ -324,7 +824,7 @@ class ConversionService:
             html_content = "<html><body>"
             
             for page_num, page in enumerate(reader.pages):
-                jobs[job_id]["progress"] = 20 + (page_num / len(reader.pages)) * 60
+                self._set_loop_progress(jobs, job_id, 20, page_num, len(reader.pages))
                 text = page.extract_text()
                 html_content += f"<div class='page'><h3>Page {page_num + 1}</h3><p>{text.replace(chr(10), '<br>')}</p></div>"
             
@@ -343,7 +843,8 @@ class ConversionService:
         
         # Method 1: PyMuPDF (fitz) - Best quality and performance
         try:
-            import fitz  # PyMuPDF
+            if fitz is None:
+                raise ImportError("PyMuPDF is not installed")
             doc = fitz.open(input_path)
             
             # Always convert first page
@@ -404,8 +905,6 @@ class ConversionService:
 
         # Method 3: Ghostscript (if available)
         try:
-            import subprocess
-            
             # Determine output format
             if output_path.lower().endswith('.jpg'):
                 device = 'jpeg'
@@ -426,7 +925,7 @@ class ConversionService:
                 f'-sOutputFile={temp_output}', input_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = self._run_command(cmd, timeout=120)
             jobs[job_id]["progress"] = 60
             
             if result.returncode == 0 and os.path.exists(temp_output):
@@ -442,7 +941,6 @@ class ConversionService:
 
         # Method 4: LibreOffice (soffice) - Convert to image
         try:
-            import subprocess
             import tempfile
             
             # Create temporary directory
@@ -453,7 +951,7 @@ class ConversionService:
                     '--outdir', temp_dir, input_path
                 ]
                 
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+                result = self._run_command(cmd, timeout=120)
                 jobs[job_id]["progress"] = 60
                 
                 if result.returncode == 0:
@@ -520,7 +1018,7 @@ class ConversionService:
             
             row = 1
             for page_num, page in enumerate(reader.pages):
-                jobs[job_id]["progress"] = 20 + (page_num / len(reader.pages)) * 60
+                self._set_loop_progress(jobs, job_id, 20, page_num, len(reader.pages))
                 text = page.extract_text()
                 lines = text.split('\n')
                 for line in lines:
@@ -540,7 +1038,7 @@ class ConversionService:
             rows = []
             
             for page_num, page in enumerate(reader.pages):
-                jobs[job_id]["progress"] = 20 + (page_num / len(reader.pages)) * 60
+                self._set_loop_progress(jobs, job_id, 20, page_num, len(reader.pages))
                 text = page.extract_text()
                 lines = text.split('\n')
                 for line in lines:
@@ -563,7 +1061,7 @@ class ConversionService:
             
             row = 1
             for page_num, page in enumerate(reader.pages):
-                jobs[job_id]["progress"] = 20 + (page_num / len(reader.pages)) * 60
+                self._set_loop_progress(jobs, job_id, 20, page_num, len(reader.pages))
                 text = page.extract_text()
                 lines = text.split('\n')
                 for line in lines:
@@ -579,7 +1077,8 @@ class ConversionService:
 
     def _pdf_to_xml(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            import pypandoc
+            if pypandoc is None:
+                raise ImportError("pypandoc is not installed")
             pypandoc.convert_file(input_path, 'xml', outputfile=output_path)
             return True
         except Exception as e:
@@ -604,7 +1103,8 @@ class ConversionService:
 
     def _pdf_to_epub(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            import pypandoc
+            if pypandoc is None:
+                raise ImportError("pypandoc is not installed")
             pypandoc.convert_file(input_path, 'epub', outputfile=output_path)
             return True
         except Exception as e:
@@ -617,15 +1117,11 @@ class ConversionService:
                 for page in reader.pages:
                     text_content += page.extract_text() + "\n\n"
                 
-                # Create a placeholder HTML file
-                temp_html_path = output_path.replace('.epub', '.html')
-                with open(temp_html_path, 'w', encoding='utf-8') as f:
-                    f.write(f"<html><body><pre>{text_content}</pre></body></html>")
-                
-                # Convert HTML to EPUB
-                import pypandoc
-                pypandoc.convert_file(temp_html_path, 'epub', outputfile=output_path)
-                os.remove(temp_html_path)
+                # Create a placeholder HTML file and convert it to EPUB
+                with self._intermediate_path('.html') as temp_html_path:
+                    with open(temp_html_path, 'w', encoding='utf-8') as f:
+                        f.write(f"<html><body><pre>{text_content}</pre></body></html>")
+                    pypandoc.convert_file(temp_html_path, 'epub', outputfile=output_path)
                 return True
             except Exception as fallback_e:
                 logger.error(f"PDF to EPUB fallback conversion error: {fallback_e}")
@@ -633,19 +1129,18 @@ class ConversionService:
 
     def _pdf_to_mobi(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            import pypandoc
+            if pypandoc is None:
+                raise ImportError("pypandoc is not installed")
             pypandoc.convert_file(input_path, 'mobi', outputfile=output_path)
             return True
         except Exception as e:
             logger.error(f"PDF to MOBI conversion error: {e}")
             # Fallback: convert to EPUB first, then to MOBI
             try:
-                temp_epub_path = output_path.replace('.mobi', '.epub')
-                if self._pdf_to_epub(input_path, temp_epub_path, job_id, jobs):
-                    result = self._epub_to_mobi(temp_epub_path, output_path, job_id, jobs)
-                    os.remove(temp_epub_path)
-                    return result
-                return False
+                with self._intermediate_path('.epub') as temp_epub_path:
+                    if self._pdf_to_epub(input_path, temp_epub_path, job_id, jobs):
+                        return self._epub_to_mobi(temp_epub_path, output_path, job_id, jobs)
+                    return False
             except Exception as fallback_e:
                 logger.error(f"PDF to MOBI fallback conversion error: {fallback_e}")
                 return False
@@ -653,14 +1148,23 @@ class ConversionService:
     # DOCX Conversion Methods
     def _docx_to_pdf(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         """Robust DOCX to PDF conversion with multiple fallbacks for cross-platform support. Now preserves block order in fallback."""
-        import subprocess
-        import shutil
-        import os
         import sys
         
         jobs[job_id]["progress"] = 10
         
         # Method 1: LibreOffice (soffice) - Best quality, works on Linux/Mac/Windows
+        # The shared instance is tried first so each file doesn't pay the soffice start-up cost.
+        try:
+            self._office_convert(input_path, output_path, 'pdf')
+            if os.path.exists(output_path):
+                jobs[job_id]["progress"] = 100
+                jobs[job_id]["conversion_method"] = "libreoffice"
+                jobs[job_id]["warning"] = None
+                logger.info("DOCX to PDF: shared LibreOffice instance conversion successful")
+                return True
+        except Exception as e:
+            logger.warning(f"Shared LibreOffice instance not available or failed: {e}")
+        
         try:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             cmd = [
@@ -670,7 +1174,7 @@ class ConversionService:
                 '--outdir', os.path.dirname(output_path),
                 input_path
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = self._run_command(cmd, timeout=120)
             jobs[job_id]["progress"] = 60
             if result.returncode == 0:
                 base_name = os.path.splitext(os.path.basename(input_path))[0]
@@ -704,7 +1208,7 @@ class ConversionService:
         # Method 3: unoconv (LibreOffice wrapper)
         try:
             cmd = ['unoconv', '-f', 'pdf', '-o', output_path, input_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = self._run_command(cmd, timeout=120)
             if result.returncode == 0:
                 jobs[job_id]["progress"] = 100
                 jobs[job_id]["conversion_method"] = "unoconv"
@@ -721,7 +1225,7 @@ class ConversionService:
         # Method 4: pandoc (if available)
         try:
             cmd = ['pandoc', input_path, '-o', output_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = self._run_command(cmd, timeout=120)
             if result.returncode == 0:
                 jobs[job_id]["progress"] = 100
                 jobs[job_id]["conversion_method"] = "pandoc"
@@ -779,7 +1283,7 @@ class ConversionService:
 
             for block in iter_block_items(doc):
                 current_element += 1
-                jobs[job_id]["progress"] = 20 + (current_element / max(total_elements,1)) * 60
+                self._set_loop_progress(jobs, job_id, 20, current_element, total_elements)
                 if isinstance(block, DocxParagraph):
                     text = block.text.strip()
                     if text:
@@ -873,7 +1377,7 @@ class ConversionService:
             text_content = ""
             
             for para_num, paragraph in enumerate(doc.paragraphs):
-                jobs[job_id]["progress"] = 20 + (para_num / len(doc.paragraphs)) * 60
+                self._set_loop_progress(jobs, job_id, 20, para_num, len(doc.paragraphs))
                 text_content += paragraph.text + "\n"
             
             with open(output_path, 'w', encoding='utf-8') as f:
@@ -889,7 +1393,7 @@ class ConversionService:
             html_content = "<html><body>"
             
             for para_num, paragraph in enumerate(doc.paragraphs):
-                jobs[job_id]["progress"] = 20 + (para_num / len(doc.paragraphs)) * 60
+                self._set_loop_progress(jobs, job_id, 20, para_num, len(doc.paragraphs))
                 if paragraph.text.strip():
                     html_content += f"<p>{paragraph.text}</p>"
             
@@ -908,7 +1412,7 @@ class ConversionService:
             rtf_content = r"{\rtf1\ansi\deff0 {\fonttbl {\f0 Times New Roman;}} \f0\fs24 "
             
             for para_num, paragraph in enumerate(doc.paragraphs):
-                jobs[job_id]["progress"] = 20 + (para_num / len(doc.paragraphs)) * 60
+                self._set_loop_progress(jobs, job_id, 20, para_num, len(doc.paragraphs))
                 if paragraph.text.strip():
                     rtf_content += paragraph.text.replace('\n', r'\par ') + r'\par '
             
@@ -924,19 +1428,18 @@ class ConversionService:
     def _docx_to_image(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
             # Convert DOCX to HTML first, then to image
-            temp_html = output_path.replace(os.path.splitext(output_path)[1], '.html')
-            if self._docx_to_html(input_path, temp_html, job_id, jobs):
-                result = self._html_to_image(temp_html, output_path, job_id, jobs)
-                os.remove(temp_html)
-                return result
-            return False
+            with self._intermediate_path('.html') as temp_html:
+                if self._docx_to_html(input_path, temp_html, job_id, jobs):
+                    return self._html_to_image(temp_html, output_path, job_id, jobs)
+                return False
         except Exception as e:
             logger.error(f"DOCX to image conversion error: {e}")
             return False
 
     def _docx_to_odt(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            import pypandoc
+            if pypandoc is None:
+                raise ImportError("pypandoc is not installed")
             pypandoc.convert_file(input_path, 'odt', outputfile=output_path)
             return True
         except Exception as e:
@@ -945,7 +1448,8 @@ class ConversionService:
 
     def _docx_to_xml(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            import pypandoc
+            if pypandoc is None:
+                raise ImportError("pypandoc is not installed")
             pypandoc.convert_file(input_path, 'docbook', outputfile=output_path)
             return True
         except Exception as e:
@@ -954,7 +1458,8 @@ class ConversionService:
 
     def _docx_to_epub(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            import pypandoc
+            if pypandoc is None:
+                raise ImportError("pypandoc is not installed")
             pypandoc.convert_file(input_path, 'epub', outputfile=output_path)
             return True
         except Exception as e:
@@ -963,19 +1468,18 @@ class ConversionService:
 
     def _docx_to_mobi(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            import pypandoc
+            if pypandoc is None:
+                raise ImportError("pypandoc is not installed")
             pypandoc.convert_file(input_path, 'mobi', outputfile=output_path)
             return True
         except Exception as e:
             logger.error(f"DOCX to MOBI conversion error: {e}")
             # Fallback: convert to EPUB first, then to MOBI
             try:
-                temp_epub_path = output_path.replace('.mobi', '.epub')
-                if self._docx_to_epub(input_path, temp_epub_path, job_id, jobs):
-                    result = self._epub_to_mobi(temp_epub_path, output_path, job_id, jobs)
-                    os.remove(temp_epub_path)
-                    return result
-                return False
+                with self._intermediate_path('.epub') as temp_epub_path:
+                    if self._docx_to_epub(input_path, temp_epub_path, job_id, jobs):
+                        return self._epub_to_mobi(temp_epub_path, output_path, job_id, jobs)
+                    return False
             except Exception as fallback_e:
                 logger.error(f"DOCX to MOBI fallback conversion error: {fallback_e}")
                 return False
@@ -983,13 +1487,19 @@ class ConversionService:
     # DOC Conversion Methods (similar to DOCX but with limited support)
     def _doc_to_pdf(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         """Robust DOC to PDF conversion with multiple fallbacks for cross-platform support."""
-        import subprocess
-        import shutil
-        import os
-        
         jobs[job_id]["progress"] = 10
         
         # Method 1: LibreOffice (soffice) - Best quality, handles complex DOC files
+        # The shared instance is tried first so each file doesn't pay the soffice start-up cost.
+        try:
+            self._office_convert(input_path, output_path, 'pdf')
+            if os.path.exists(output_path):
+                jobs[job_id]["progress"] = 100
+                logger.info("DOC to PDF: shared LibreOffice instance conversion successful")
+                return True
+        except Exception as e:
+            logger.warning(f"Shared LibreOffice instance not available or failed: {e}")
+        
         try:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             cmd = [
@@ -999,7 +1509,7 @@ class ConversionService:
                 '--outdir', os.path.dirname(output_path),
                 input_path
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = self._run_command(cmd, timeout=120)
             jobs[job_id]["progress"] = 60
             
             if result.returncode == 0:
@@ -1018,7 +1528,7 @@ class ConversionService:
         # Method 2: unoconv (LibreOffice wrapper)
         try:
             cmd = ['unoconv', '-f', 'pdf', '-o', output_path, input_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = self._run_command(cmd, timeout=120)
             if result.returncode == 0:
                 jobs[job_id]["progress"] = 100
                 logger.info("DOC to PDF: unoconv conversion successful")
@@ -1031,7 +1541,7 @@ class ConversionService:
         # Method 3: pandoc (if available)
         try:
             cmd = ['pandoc', input_path, '-o', output_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = self._run_command(cmd, timeout=120)
             if result.returncode == 0:
                 jobs[job_id]["progress"] = 100
                 logger.info("DOC to PDF: pandoc conversion successful")
@@ -1044,7 +1554,7 @@ class ConversionService:
         # Method 4: antiword (Linux/Unix only)
         try:
             cmd = ['antiword', input_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            result = self._run_command(cmd, timeout=60)
             if result.returncode == 0:
                 # Convert text to PDF
                 from reportlab.pdfgen import canvas
@@ -1079,7 +1589,7 @@ class ConversionService:
         # Method 5: catdoc (Linux/Unix only)
         try:
             cmd = ['catdoc', input_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            result = self._run_command(cmd, timeout=60)
             if result.returncode == 0:
                 # Convert text to PDF
                 from reportlab.pdfgen import canvas
@@ -1199,13 +1709,19 @@ class ConversionService:
     
     def _xlsx_to_pdf(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         """Robust XLSX to PDF conversion with multiple fallbacks for cross-platform support."""
-        import subprocess
-        import shutil
-        import os
-        
         jobs[job_id]["progress"] = 10
         
         # Method 1: LibreOffice (soffice) - Best quality, preserves formatting
+        # The shared instance is tried first so each file doesn't pay the soffice start-up cost.
+        try:
+            self._office_convert(input_path, output_path, 'pdf')
+            if os.path.exists(output_path):
+                jobs[job_id]["progress"] = 100
+                logger.info("XLSX to PDF: shared LibreOffice instance conversion successful")
+                return True
+        except Exception as e:
+            logger.warning(f"Shared LibreOffice instance not available or failed: {e}")
+        
         try:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             cmd = [
@@ -1215,7 +1731,7 @@ class ConversionService:
                 '--outdir', os.path.dirname(output_path),
                 input_path
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = self._run_command(cmd, timeout=120)
             jobs[job_id]["progress"] = 60
             
             if result.returncode == 0:
@@ -1234,7 +1750,7 @@ class ConversionService:
         # Method 2: unoconv (LibreOffice wrapper)
         try:
             cmd = ['unoconv', '-f', 'pdf', '-o', output_path, input_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = self._run_command(cmd, timeout=120)
             if result.returncode == 0:
                 jobs[job_id]["progress"] = 100
                 logger.info("XLSX to PDF: unoconv conversion successful")
@@ -1416,7 +1932,8 @@ class ConversionService:
 
     def _xlsx_to_ods(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            import pypandoc
+            if pypandoc is None:
+                raise ImportError("pypandoc is not installed")
             pypandoc.convert_file(input_path, 'ods', outputfile=output_path)
             return True
         except Exception as e:
@@ -1492,9 +2009,8 @@ class ConversionService:
 
         # Method 2: ImageMagick (if available)
         try:
-            import subprocess
             cmd = ['convert', input_path, output_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            result = self._run_command(cmd, timeout=60)
             if result.returncode == 0:
                 jobs[job_id]["progress"] = 100
                 logger.info(f"Image conversion: ImageMagick successful ({os.path.basename(input_path)} -> {os.path.basename(output_path)})")
@@ -1506,9 +2022,8 @@ class ConversionService:
 
         # Method 3: FFmpeg (for video-like images or complex formats)
         try:
-            import subprocess
             cmd = ['ffmpeg', '-i', input_path, '-y', output_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            result = self._run_command(cmd, timeout=60)
             if result.returncode == 0:
                 jobs[job_id]["progress"] = 100
                 logger.info(f"Image conversion: FFmpeg successful ({os.path.basename(input_path)} -> {os.path.basename(output_path)})")
@@ -1541,8 +2056,7 @@ class ConversionService:
 
         # Method 5: Last resort - try to copy and rename (if formats are compatible)
         try:
-            import shutil
-            shutil.copy2(input_path, output_path)
+            self._fast_copy(input_path, output_path)
             jobs[job_id]["progress"] = 100
             logger.info(f"Image conversion: Copy successful ({os.path.basename(input_path)} -> {os.path.basename(output_path)})")
             return True
@@ -1570,9 +2084,8 @@ class ConversionService:
 
         # Method 2: ImageMagick (if available)
         try:
-            import subprocess
             cmd = ['convert', input_path, output_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            result = self._run_command(cmd, timeout=60)
             if result.returncode == 0:
                 jobs[job_id]["progress"] = 100
                 logger.info("Image to PDF: ImageMagick conversion successful")
@@ -1646,12 +2159,10 @@ class ConversionService:
     def _image_to_docx(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
             # Convert image to HTML first, then to DOCX
-            temp_html = output_path.replace(os.path.splitext(output_path)[1], '.html')
-            if self._image_to_html(input_path, temp_html, job_id, jobs):
-                result = self._html_to_docx(temp_html, output_path, job_id, jobs)
-                os.remove(temp_html)
-                return result
-            return False
+            with self._intermediate_path('.html') as temp_html:
+                if self._image_to_html(input_path, temp_html, job_id, jobs):
+                    return self._html_to_docx(temp_html, output_path, job_id, jobs)
+                return False
         except Exception as e:
             logger.error(f"Image to DOCX conversion error: {e}")
             return False
@@ -1659,12 +2170,10 @@ class ConversionService:
     def _image_to_doc(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
             # Convert image to HTML first, then to DOC
-            temp_html = output_path.replace(os.path.splitext(output_path)[1], '.html')
-            if self._image_to_html(input_path, temp_html, job_id, jobs):
-                result = self._html_to_doc(temp_html, output_path, job_id, jobs)
-                os.remove(temp_html)
-                return result
-            return False
+            with self._intermediate_path('.html') as temp_html:
+                if self._image_to_html(input_path, temp_html, job_id, jobs):
+                    return self._html_to_doc(temp_html, output_path, job_id, jobs)
+                return False
         except Exception as e:
             logger.error(f"Image to DOC conversion error: {e}")
             return False
@@ -1672,12 +2181,10 @@ class ConversionService:
     def _image_to_xlsx(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
             # Convert image to HTML first, then to XLSX
-            temp_html = output_path.replace(os.path.splitext(output_path)[1], '.html')
-            if self._image_to_html(input_path, temp_html, job_id, jobs):
-                result = self._html_to_xlsx(temp_html, output_path, job_id, jobs)
-                os.remove(temp_html)
-                return result
-            return False
+            with self._intermediate_path('.html') as temp_html:
+                if self._image_to_html(input_path, temp_html, job_id, jobs):
+                    return self._html_to_xlsx(temp_html, output_path, job_id, jobs)
+                return False
         except Exception as e:
             logger.error(f"Image to XLSX conversion error: {e}")
             return False
@@ -1685,12 +2192,10 @@ class ConversionService:
     def _image_to_pptx(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
             # Convert image to HTML first, then to PPTX
-            temp_html = output_path.replace(os.path.splitext(output_path)[1], '.html')
-            if self._image_to_html(input_path, temp_html, job_id, jobs):
-                result = self._html_to_pptx(temp_html, output_path, job_id, jobs)
-                os.remove(temp_html)
-                return result
-            return False
+            with self._intermediate_path('.html') as temp_html:
+                if self._image_to_html(input_path, temp_html, job_id, jobs):
+                    return self._html_to_pptx(temp_html, output_path, job_id, jobs)
+                return False
         except Exception as e:
             logger.error(f"Image to PPTX conversion error: {e}")
             return False
@@ -1698,12 +2203,10 @@ class ConversionService:
     def _image_to_txt(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
             # Convert image to HTML first, then to TXT
-            temp_html = output_path.replace(os.path.splitext(output_path)[1], '.html')
-            if self._image_to_html(input_path, temp_html, job_id, jobs):
-                result = self._html_to_txt(temp_html, output_path, job_id, jobs)
-                os.remove(temp_html)
-                return result
-            return False
+            with self._intermediate_path('.html') as temp_html:
+                if self._image_to_html(input_path, temp_html, job_id, jobs):
+                    return self._html_to_txt(temp_html, output_path, job_id, jobs)
+                return False
         except Exception as e:
             logger.error(f"Image to TXT conversion error: {e}")
             return False
@@ -1738,10 +2241,9 @@ class ConversionService:
                 svg2png(url=input_path, write_to=output_path)
             else:
                 # Convert to PNG first, then to target format
-                temp_png = output_path.replace(os.path.splitext(output_path)[1], '.png')
-                svg2png(url=input_path, write_to=temp_png)
-                self._image_convert(temp_png, output_path, job_id, jobs)
-                os.remove(temp_png)
+                with self._intermediate_path('.png') as temp_png:
+                    svg2png(url=input_path, write_to=temp_png)
+                    self._image_convert(temp_png, output_path, job_id, jobs)
             return True
         except Exception as e:
             logger.error(f"SVG to image conversion error: {e}")
@@ -1836,13 +2338,10 @@ class ConversionService:
     
     def _txt_to_csv(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                for line in lines:
-                    writer.writerow([line.strip()])
+            # Stream lines straight into the C writer; a large buffer keeps syscalls down
+            with open(input_path, 'r', encoding='utf-8') as src, \
+                    open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                csv.writer(f).writerows([line.strip()] for line in src)
             return True
         except Exception as e:
             logger.error(f"TXT to CSV conversion error: {e}")
@@ -1855,8 +2354,8 @@ class ConversionService:
             
             data = {"lines": [line.strip() for line in lines]}
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            with open(output_path, 'wb') as f:
+                f.write(self._dumps_json(data))
             return True
         except Exception as e:
             logger.error(f"TXT to JSON conversion error: {e}")
@@ -1865,15 +2364,12 @@ class ConversionService:
     # HTML Conversion Methods
     def _html_to_pdf(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         """Robust HTML to PDF conversion with multiple fallbacks for cross-platform support."""
-        import subprocess
-        import os
-        
         jobs[job_id]["progress"] = 10
         
         # Method 1: wkhtmltopdf (best for complex HTML with CSS)
         try:
             cmd = ['wkhtmltopdf', '--quiet', '--no-stop-slow-scripts', input_path, output_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = self._run_command(cmd, timeout=120)
             jobs[job_id]["progress"] = 60
             
             if result.returncode == 0 and os.path.exists(output_path):
@@ -1913,7 +2409,7 @@ class ConversionService:
         # Method 4: pandoc (if available)
         try:
             cmd = ['pandoc', input_path, '-o', output_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = self._run_command(cmd, timeout=120)
             if result.returncode == 0:
                 jobs[job_id]["progress"] = 100
                 logger.info("HTML to PDF: pandoc conversion successful")
@@ -1925,26 +2421,19 @@ class ConversionService:
 
         # Method 5: BeautifulSoup + reportlab (text extraction)
         try:
-            from bs4 import BeautifulSoup
             from reportlab.pdfgen import canvas
             from reportlab.lib.pagesizes import letter
             from reportlab.lib.styles import getSampleStyleSheet
             from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
             
-            with open(input_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = self._get_soup(input_path)
             
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            # Get text content
-            text = soup.get_text()
+            # Get text content, skipping script and style elements (the cached soup is shared, so no decompose)
+            text = "".join(s for s in soup.strings if s.parent.name not in ("script", "style"))
             
             # Create PDF
-            pdf_doc = SimpleDocTemplate(output_path, pagesize=letter)
+            buffer = io.BytesIO()
+            pdf_doc = SimpleDocTemplate(buffer, pagesize=letter)
             styles = getSampleStyleSheet()
             story = []
             
@@ -1957,6 +2446,7 @@ class ConversionService:
             
             if story:
                 pdf_doc.build(story)
+                self._write_output(output_path, buffer)
                 jobs[job_id]["progress"] = 100
                 logger.info("HTML to PDF: BeautifulSoup + reportlab fallback successful")
                 return True
@@ -1969,19 +2459,18 @@ class ConversionService:
 
         # Method 6: Simple text extraction
         try:
-            with open(input_path, 'r', encoding='utf-8') as f:
+            with open(input_path, 'rb') as f:
                 html_content = f.read()
             
-            # Simple HTML tag removal
-            import re
-            text = re.sub(r'<[^>]+>', '', html_content)
-            text = re.sub(r'\s+', ' ', text).strip()
+            # Simple HTML tag removal on the raw bytes, decoding only the remaining text
+            text = _WS_RE.sub(b' ', _TAG_RE.sub(b'', html_content)).strip().decode('utf-8', 'replace')
             
             if text:
                 from reportlab.pdfgen import canvas
                 from reportlab.lib.pagesizes import letter
                 
-                c = canvas.Canvas(output_path, pagesize=letter)
+                buffer = io.BytesIO()
+                c = canvas.Canvas(buffer, pagesize=letter)
                 width, height = letter
                 
                 lines = text.split('\n')
@@ -1999,6 +2488,7 @@ class ConversionService:
                     y -= 15
                 
                 c.save()
+                self._write_output(output_path, buffer)
                 jobs[job_id]["progress"] = 100
                 logger.info("HTML to PDF: Simple text extraction successful")
                 return True
@@ -2013,19 +2503,17 @@ class ConversionService:
     
     def _html_to_docx(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            soup = BeautifulSoup(html_content, 'html.parser')
-            text = soup.get_text()
+            soup = self._get_soup(input_path)
             
             doc = Document()
-            lines = text.split('\n')
-            for line in lines:
-                if line.strip():
-                    doc.add_paragraph(line.strip())
+            for line in self._iter_text_lines(soup):
+                line = line.strip()
+                if line:
+                    doc.add_paragraph(line)
             
-            doc.save(output_path)
+            buffer = io.BytesIO()
+            doc.save(buffer)
+            self._write_output(output_path, buffer)
             return True
         except Exception as e:
             logger.error(f"HTML to DOCX conversion error: {e}")
@@ -2062,7 +2550,8 @@ class ConversionService:
 
     def _html_to_epub(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            import pypandoc
+            if pypandoc is None:
+                raise ImportError("pypandoc is not installed")
             pypandoc.convert_file(input_path, 'epub', outputfile=output_path)
             return True
         except Exception as e:
@@ -2071,19 +2560,18 @@ class ConversionService:
 
     def _html_to_mobi(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            import pypandoc
+            if pypandoc is None:
+                raise ImportError("pypandoc is not installed")
             pypandoc.convert_file(input_path, 'mobi', outputfile=output_path)
             return True
         except Exception as e:
             logger.error(f"HTML to MOBI conversion error: {e}")
             # Fallback: convert to EPUB first, then to MOBI
             try:
-                temp_epub_path = output_path.replace('.mobi', '.epub')
-                if self._html_to_epub(input_path, temp_epub_path, job_id, jobs):
-                    result = self._epub_to_mobi(temp_epub_path, output_path, job_id, jobs)
-                    os.remove(temp_epub_path)
-                    return result
-                return False
+                with self._intermediate_path('.epub') as temp_epub_path:
+                    if self._html_to_epub(input_path, temp_epub_path, job_id, jobs):
+                        return self._epub_to_mobi(temp_epub_path, output_path, job_id, jobs)
+                    return False
             except Exception as fallback_e:
                 logger.error(f"HTML to MOBI fallback conversion error: {fallback_e}")
                 return False
@@ -2092,19 +2580,29 @@ class ConversionService:
     def _csv_to_xlsx(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
             df = pd.read_csv(input_path)
-            df.to_excel(output_path, index=False)
+            buffer = io.BytesIO()
+            df.to_excel(buffer, index=False)
+            self._write_output(output_path, buffer)
             return True
         except Exception as e:
             logger.error(f"CSV to XLSX conversion error: {e}")
             return False
     
     def _csv_to_json(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
-        try:
-            df = pd.read_csv(input_path)
-            json_data = df.to_json(orient='records', indent=2)
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(json_data)
+        """Stream CSV rows to a JSON array chunk by chunk"""
+        try:
+            with open(output_path, 'wb', buffering=1 << 20) as f:
+                f.write(b'[\n')
+                first = True
+                for chunk in pd.read_csv(input_path, chunksize=CSV_JSON_CHUNK_ROWS):
+                    # Missing values become null, as with DataFrame.to_json
+                    chunk = chunk.astype(object).where(chunk.notna(), None)
+                    for record in chunk.to_dict(orient='records'):
+                        if not first:
+                            f.write(b',\n')
+                        f.write(self._dumps_json(record))
+                        first = False
+                f.write(b'\n]' if not first else b']')
             return True
         except Exception as e:
             logger.error(f"CSV to JSON conversion error: {e}")
@@ -2136,19 +2634,12 @@ class ConversionService:
     
     def _csv_to_pdf(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            df = pd.read_csv(input_path)
-            
             from reportlab.lib import colors
             from reportlab.lib.pagesizes import letter, A4
-            from reportlab.platypus import SimpleDocTemplate, Table, TableStyle
+            from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, PageBreak
             
             doc = SimpleDocTemplate(output_path, pagesize=A4)
-            
-            # Convert DataFrame to list of lists
-            data = [df.columns.tolist()] + df.values.tolist()
-            
-            table = Table(data)
-            table.setStyle(TableStyle([
+            style = TableStyle([
                 ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
                 ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
                 ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
@@ -2157,18 +2648,68 @@ class ConversionService:
                 ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
                 ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
                 ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
+            ])
             
-            doc.build([table])
+            # One table per chunk of rows, so ReportLab never has to split a single huge table
+            story = []
+            for data in self._iter_csv_table_chunks(input_path):
+                if story:
+                    story.append(PageBreak())
+                story.append(Table(data, style=style, repeatRows=1))
+            
+            if not story:
+                # Header-only CSV
+                header = pd.read_csv(input_path, nrows=0).columns.tolist()
+                story.append(Table([header], style=style))
+            
+            doc.build(story)
             return True
         except Exception as e:
             logger.error(f"CSV to PDF conversion error: {e}")
             return False
 
+    def _iter_csv_table_chunks(self, input_path: str):
+        """Yield table data for a CSV in chunks of CSV_PDF_CHUNK_ROWS rows, each led by the header row"""
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+            import pyarrow.csv as pa_csv
+        except ImportError:
+            pa = None
+        
+        reader = None
+        if pa is not None:
+            try:
+                # Every column is read as text, so cells print exactly as written; a first reader
+                # is opened only to learn the column names
+                header = pa_csv.open_csv(input_path).schema.names
+                convert_options = pa_csv.ConvertOptions(column_types={name: pa.string() for name in header})
+                reader = pa_csv.open_csv(input_path, convert_options=convert_options)
+            except pa.ArrowException as e:
+                logger.warning(f"pyarrow CSV read failed, falling back to pandas: {e}")
+        
+        if reader is not None:
+            # Batches stream in block by block; regroup them into CSV_PDF_CHUNK_ROWS-row chunks
+            rows = []
+            for batch in reader:
+                # Build rows from Arrow columns instead of boxing a NumPy object array
+                rows.extend(zip(*(pc.fill_null(column, '').to_pylist() for column in batch.columns)))
+                while len(rows) >= CSV_PDF_CHUNK_ROWS:
+                    yield [header] + rows[:CSV_PDF_CHUNK_ROWS]
+                    del rows[:CSV_PDF_CHUNK_ROWS]
+            if rows:
+                yield [header] + rows
+            return
+        
+        for chunk in pd.read_csv(input_path, chunksize=CSV_PDF_CHUNK_ROWS):
+            yield [chunk.columns.tolist()] + chunk.astype(object).values.tolist()
+    
     def _csv_to_xls(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
             df = pd.read_csv(input_path)
-            df.to_excel(output_path, index=False, engine='openpyxl')
+            buffer = io.BytesIO()
+            df.to_excel(buffer, index=False, engine='openpyxl')
+            self._write_output(output_path, buffer)
             return True
         except Exception as e:
             logger.error(f"CSV to XLS conversion error: {e}")
@@ -2184,10 +2725,60 @@ class ConversionService:
             return False
     
     # JSON Conversion Methods
+    def _read_json(self, path: str) -> Any:
+        """Load a JSON file, using orjson when it is installed"""
+        with open(path, 'rb') as f:
+            raw = f.read()
+        if orjson is not None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # orjson rejects some inputs the stdlib accepts (e.g. integers beyond 64 bits)
+                pass
+        return json.loads(raw)
+
+    def _dumps_json(self, data: Any) -> bytes:
+        """Serialize data as indented UTF-8 JSON, using orjson when it is installed"""
+        if orjson is not None:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                pass
+        return json.dumps(data, indent=2).encode('utf-8')
+    
+    def _read_json_lines(self, path: str) -> list:
+        """Load a newline-delimited JSON file as a list of values"""
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(path, 'rb') as f:
+            return [loads(line) for line in f if line.strip()]
+    
+    def _csv_column_texts(self, values: list) -> list:
+        """Format one column of JSON values the way DataFrame.to_csv would"""
+        present = [v for v in values if v is not None]
+        numeric = all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present)
+        if present and numeric and (len(present) < len(values) or any(isinstance(v, float) for v in present)):
+            # pandas holds this column as float64: ints print as 1.0 and missing values as blanks
+            return ['' if v is None else repr(float(v)) for v in values]
+        return ['' if v is None else str(v) for v in values]
+    
     def _json_to_csv(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            try:
+                data = self._read_json(input_path)
+            except ValueError:
+                # Not a single JSON document; try newline-delimited JSON
+                data = self._read_json_lines(input_path)
+            
+            if isinstance(data, list) and data and all(isinstance(row, dict) for row in data):
+                # Written with the csv module directly (as pandas does internally), skipping the DataFrame;
+                # columns are the union of keys in order of appearance, as DataFrame(data) would give
+                columns = list(dict.fromkeys(key for row in data for key in row))
+                texts = [self._csv_column_texts([row.get(col) for row in data]) for col in columns]
+                with open(output_path, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f, lineterminator='\n')
+                    writer.writerow(columns)
+                    writer.writerows(zip(*texts))
+                return True
             
             if isinstance(data, list):
                 df = pd.DataFrame(data)
@@ -2204,8 +2795,7 @@ class ConversionService:
     
     def _json_to_xml(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_json(input_path)
             
             import dicttoxml
             xml_content = dicttoxml.dicttoxml(data, custom_root='root', attr_type=False)
@@ -2219,14 +2809,13 @@ class ConversionService:
     
     def _json_to_html(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_json(input_path)
             
             if isinstance(data, list):
                 df = pd.DataFrame(data)
                 html_content = df.to_html()
             else:
-                html_content = f"<html><body><pre>{json.dumps(data, indent=2)}</pre></body></html>"
+                html_content = f"<html><body><pre>{self._dumps_json(data).decode('utf-8')}</pre></body></html>"
             
             with open(output_path, 'w', encoding='utf-8') as f:
                 f.write(html_content)
@@ -2237,8 +2826,7 @@ class ConversionService:
     
     def _json_to_xlsx(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_json(input_path)
             
             if isinstance(data, list):
                 df = pd.DataFrame(data)
@@ -2247,7 +2835,9 @@ class ConversionService:
             else:
                 df = pd.DataFrame({'value': [data]})
             
-            df.to_excel(output_path, index=False)
+            buffer = io.BytesIO()
+            df.to_excel(buffer, index=False)
+            self._write_output(output_path, buffer)
             return True
         except Exception as e:
             logger.error(f"JSON to XLSX conversion error: {e}")
@@ -2255,10 +2845,9 @@ class ConversionService:
 
     def _json_to_txt(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(json.dumps(data, indent=2))
+            data = self._read_json(input_path)
+            with open(output_path, 'wb') as f:
+                f.write(self._dumps_json(data))
             return True
         except Exception as e:
             logger.error(f"JSON to TXT conversion error: {e}")
@@ -2266,8 +2855,7 @@ class ConversionService:
 
     def _json_to_xls(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_json(input_path)
             
             if isinstance(data, list):
                 df = pd.DataFrame(data)
@@ -2276,7 +2864,9 @@ class ConversionService:
             else:
                 df = pd.DataFrame({'value': [data]})
             
-            df.to_excel(output_path, index=False, engine='openpyxl')
+            buffer = io.BytesIO()
+            df.to_excel(buffer, index=False, engine='openpyxl')
+            self._write_output(output_path, buffer)
             return True
         except Exception as e:
             logger.error(f"JSON to XLS conversion error: {e}")
@@ -2285,29 +2875,45 @@ class ConversionService:
     # XML Conversion Methods
     def _xml_to_json(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            import xmltodict
-            with open(input_path, 'r', encoding='utf-8') as f:
-                xml_content = f.read()
-            
-            data = xmltodict.parse(xml_content)
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            # Parse straight from disk with lxml's C parser
+            root = self._get_xml_tree(input_path).getroot()
+            data = {root.tag: self._xml_element_to_dict(root)}
+
+            with open(output_path, 'wb') as f:
+                f.write(self._dumps_json(data))
             return True
         except Exception as e:
             logger.error(f"XML to JSON conversion error: {e}")
             return False
+
+    def _xml_element_to_dict(self, elem) -> Any:
+        """Convert an lxml element to the xmltodict-style structure (@attrs, #text, repeated tags as lists)"""
+        children = [child for child in elem if isinstance(child.tag, str)]
+        text = elem.text.strip() if elem.text and elem.text.strip() else None
+
+        if not children and not elem.attrib:
+            return text
+
+        result: Dict[str, Any] = {f"@{key}": value for key, value in elem.attrib.items()}
+        grouped = defaultdict(list)
+        for child in children:
+            grouped[child.tag].append(self._xml_element_to_dict(child))
+        for tag, values in grouped.items():
+            result[tag] = values[0] if len(values) == 1 else values
+        if text is not None:
+            result["#text"] = text
+        return result
     
     def _xml_to_csv(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            tree = ET.parse(input_path)
-            root = tree.getroot()
+            from lxml import etree
+            root = self._get_xml_tree(input_path).getroot()
             
-            # Extract data from XML (simplified approach)
+            # Extract data from XML (simplified approach); lxml also yields comments/PIs, so ask for elements only
             rows = []
-            for child in root:
+            for child in root.iterchildren(etree.Element):
                 row = {}
-                for subchild in child:
+                for subchild in child.iterchildren(etree.Element):
                     row[subchild.tag] = subchild.text
                 rows.append(row)
             
@@ -2316,12 +2922,14 @@ class ConversionService:
                 df.to_csv(output_path, index=False)
             else:
                 # Fallback: create simple CSV with tag names and values
-                with open(output_path, 'w', newline='', encoding='utf-8') as f:
+                with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
                     writer = csv.writer(f)
                     writer.writerow(['tag', 'value'])
-                    for elem in root.iter():
-                        if elem.text and elem.text.strip():
-                            writer.writerow([elem.tag, elem.text.strip()])
+                    writer.writerows(
+                        [elem.tag, elem.text.strip()]
+                        for elem in root.iter(etree.Element)
+                        if elem.text and elem.text.strip()
+                    )
             
             return True
         except Exception as e:
@@ -2376,13 +2984,19 @@ class ConversionService:
     # PowerPoint Conversion Methods
     def _pptx_to_pdf(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         """Robust PPTX to PDF conversion with multiple fallbacks for cross-platform support."""
-        import subprocess
-        import shutil
-        import os
-        
         jobs[job_id]["progress"] = 10
         
-        # Method 1: LibreOffice (soffice) - Best quality, preserves formatting and images
+        # Method 1: LibreOffice - Best quality, preserves formatting and images.
+        # The shared instance is tried first so each file doesn't pay the soffice start-up cost.
+        try:
+            self._office_convert(input_path, output_path, 'pdf')
+            if os.path.exists(output_path):
+                jobs[job_id]["progress"] = 100
+                logger.info("PPTX to PDF: shared LibreOffice instance conversion successful")
+                return True
+        except Exception as e:
+            logger.warning(f"Shared LibreOffice instance not available or failed: {e}")
+        
         try:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             cmd = [
@@ -2392,7 +3006,7 @@ class ConversionService:
                 '--outdir', os.path.dirname(output_path),
                 input_path
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = self._run_command(cmd, timeout=120)
             jobs[job_id]["progress"] = 60
             
             if result.returncode == 0:
@@ -2411,7 +3025,7 @@ class ConversionService:
         # Method 2: unoconv (LibreOffice wrapper)
         try:
             cmd = ['unoconv', '-f', 'pdf', '-o', output_path, input_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = self._run_command(cmd, timeout=120)
             if result.returncode == 0:
                 jobs[job_id]["progress"] = 100
                 logger.info("PPTX to PDF: unoconv conversion successful")
@@ -2423,20 +3037,19 @@ class ConversionService:
 
         # Method 3: python-pptx + reportlab (text and basic formatting)
         try:
-            from pptx import Presentation
             from reportlab.pdfgen import canvas
             from reportlab.lib.pagesizes import letter
             from reportlab.lib.colors import black, white
             from reportlab.lib.units import inch
             
-            prs = Presentation(input_path)
+            slide_texts = self._get_slide_texts(input_path)
             jobs[job_id]["progress"] = 30
             
             c = canvas.Canvas(output_path, pagesize=letter)
             width, height = letter
             
-            for slide_num, slide in enumerate(prs.slides):
-                jobs[job_id]["progress"] = 30 + (slide_num / len(prs.slides)) * 60
+            for slide_num, texts in enumerate(slide_texts):
+                self._set_loop_progress(jobs, job_id, 30, slide_num, len(slide_texts))
                 
                 # Start new page for each slide
                 if slide_num > 0:
@@ -2450,36 +3063,16 @@ class ConversionService:
                 
                 # Process slide content
                 c.setFont("Helvetica", 12)
-                for shape in slide.shapes:
-                    if hasattr(shape, "text") and shape.text:
-                        lines = shape.text.split('\n')
-                        for line in lines:
+                for text in texts:
+                    for line in text.split('\n'):
+                        # Wrap long lines at 80 characters (empty lines still take a row)
+                        for wrapped in textwrap.wrap(line, width=80) or ['']:
                             if y < 50:
                                 c.showPage()
                                 y = height - 50
                                 c.setFont("Helvetica", 12)
-                            
-                            # Handle long lines
-                            if len(line) > 80:
-                                words = line.split(' ')
-                                current_line = ""
-                                for word in words:
-                                    if len(current_line + word) < 80:
-                                        current_line += word + " "
-                                    else:
-                                        c.drawString(70, y, current_line)
-                                        y -= 20
-                                        current_line = word + " "
-                                        if y < 50:
-                                            c.showPage()
-                                            y = height - 50
-                                            c.setFont("Helvetica", 12)
-                                if current_line:
-                                    c.drawString(70, y, current_line)
-                                    y -= 20
-                            else:
-                                c.drawString(70, y, line[:80])
-                                y -= 20
+                            c.drawString(70, y, wrapped)
+                            y -= 20
             
             c.save()
             jobs[job_id]["progress"] = 100
@@ -2492,7 +3085,7 @@ class ConversionService:
         # Method 4: pandoc (if available)
         try:
             cmd = ['pandoc', input_path, '-o', output_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = self._run_command(cmd, timeout=120)
             if result.returncode == 0:
                 jobs[job_id]["progress"] = 100
                 logger.info("PPTX to PDF: pandoc conversion successful")
@@ -2504,11 +3097,10 @@ class ConversionService:
 
         # Method 5: Create a simple PDF with slide information
         try:
-            from pptx import Presentation
             from reportlab.pdfgen import canvas
             from reportlab.lib.pagesizes import letter
             
-            prs = Presentation(input_path)
+            slide_texts = self._get_slide_texts(input_path)
             
             c = canvas.Canvas(output_path, pagesize=letter)
             width, height = letter
@@ -2517,12 +3109,12 @@ class ConversionService:
             c.setFont("Helvetica-Bold", 18)
             c.drawString(50, height - 50, "PowerPoint Presentation")
             c.setFont("Helvetica", 12)
-            c.drawString(50, height - 80, f"Total Slides: {len(prs.slides)}")
+            c.drawString(50, height - 80, f"Total Slides: {len(slide_texts)}")
             c.drawString(50, height - 100, f"File: {os.path.basename(input_path)}")
             
             # Add slide information
             y = height - 140
-            for i, slide in enumerate(prs.slides):
+            for i, texts in enumerate(slide_texts):
                 if y < 50:
                     c.showPage()
                     y = height - 50
@@ -2531,13 +3123,7 @@ class ConversionService:
                 c.drawString(50, y, f"Slide {i + 1}:")
                 y -= 20
                 
-                # Count text elements
-                text_count = 0
-                for shape in slide.shapes:
-                    if hasattr(shape, "text") and shape.text:
-                        text_count += 1
-                
-                c.drawString(70, y, f"Text elements: {text_count}")
+                c.drawString(70, y, f"Text elements: {len(texts)}")
                 y -= 30
             
             c.save()
@@ -2564,16 +3150,13 @@ class ConversionService:
     
     def _pptx_to_html(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            prs = Presentation(input_path)
-            
             html_content = "<html><body>"
             
-            for slide_num, slide in enumerate(prs.slides):
+            for slide_num, texts in enumerate(self._get_slide_texts(input_path)):
                 html_content += f"<div class='slide'><h2>Slide {slide_num + 1}</h2>"
                 
-                for shape in slide.shapes:
-                    if hasattr(shape, "text") and shape.text:
-                        html_content += f"<p>{shape.text}</p>"
+                for text in texts:
+                    html_content += f"<p>{text}</p>"
                 
                 html_content += "</div><hr>"
             
@@ -2590,7 +3173,7 @@ class ConversionService:
         try:
             # Direct conversion from PPTX to PPT is not reliable with most tools.
             # We can copy the file if the extension is just changed.
-            shutil.copy(input_path, output_path)
+            self._fast_copy(input_path, output_path)
             return True
         except Exception as e:
             logger.error(f"PPTX to PPT conversion error: {e}")
@@ -2604,17 +3187,23 @@ class ConversionService:
                 return False
 
     def _pptx_to_odp(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
+        # Warm the page cache while pandoc/LibreOffice start up
+        self._prefetch(input_path)
         try:
-            import pypandoc
+            if pypandoc is None:
+                raise ImportError("pypandoc is not installed")
             pypandoc.convert_file(input_path, 'odp', outputfile=output_path)
             return True
         except Exception as e:
             logger.error(f"PPTX to ODP conversion error: {e}")
-            # Fallback to LibreOffice
+            # Fallback to LibreOffice, preferring the shared instance
+            try:
+                self._office_convert(input_path, output_path, 'odp')
+                if os.path.exists(output_path):
+                    return True
+            except Exception as office_e:
+                logger.warning(f"Shared LibreOffice instance not available or failed: {office_e}")
             try:
-                import subprocess
-                import shutil
-                
                 temp_dir = os.path.dirname(output_path)
                 os.makedirs(temp_dir, exist_ok=True)
                 cmd = [
@@ -2624,7 +3213,7 @@ class ConversionService:
                     '--outdir', temp_dir,
                     input_path
                 ]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+                result = self._run_command(cmd, timeout=120)
                 
                 if result.returncode == 0:
                     base_name = os.path.splitext(os.path.basename(input_path))[0]
@@ -2654,9 +3243,33 @@ class ConversionService:
         """Robust audio conversion with multiple fallbacks for cross-platform support."""
         jobs[job_id]["progress"] = 10
         
-        # Method 1: pydub (Python library) - Primary method
+        # Remux without re-encoding when the codecs already fit the target container
+        if self._try_stream_copy(input_path, output_path, True, job_id, jobs):
+            return True
+        
+        # Method 1: FFmpeg (command line) - Best quality and format support, bounded by a timeout
+        try:
+            # Get output format from file extension
+            output_format = os.path.splitext(output_path)[1][1:].lower()
+            
+            args = AUDIO_FFMPEG_ARGS.get(output_format, ())
+            
+            result = self._run_ffmpeg(input_path, output_path, args, timeout=300)
+            jobs[job_id]["progress"] = 60
+            
+            if result.returncode == 0:
+                jobs[job_id]["progress"] = 100
+                logger.info(f"Audio conversion: FFmpeg successful ({os.path.basename(input_path)} -> {os.path.basename(output_path)})")
+                return True
+            else:
+                logger.warning(f"FFmpeg failed: {result.stderr}")
+        except Exception as e:
+            logger.warning(f"FFmpeg not available or failed: {e}")
+
+        # Method 2: pydub (Python library) - decodes in memory and has no timeout, so it runs after ffmpeg
         try:
-            from pydub import AudioSegment
+            if AudioSegment is None:
+                raise ImportError("pydub is not installed")
             
             # Load audio file
             audio = AudioSegment.from_file(input_path)
@@ -2689,46 +3302,10 @@ class ConversionService:
         except Exception as e:
             logger.warning(f"pydub conversion failed: {e}")
 
-        # Method 2: FFmpeg (command line) - Best quality and format support
-        try:
-            import subprocess
-            
-            # Get output format from file extension
-            output_format = os.path.splitext(output_path)[1][1:].lower()
-            
-            # Build FFmpeg command with quality settings
-            if output_format == 'mp3':
-                cmd = ['ffmpeg', '-i', input_path, '-acodec', 'libmp3lame', '-ab', '192k', '-y', output_path]
-            elif output_format == 'wav':
-                cmd = ['ffmpeg', '-i', input_path, '-acodec', 'pcm_s16le', '-y', output_path]
-            elif output_format == 'aac':
-                cmd = ['ffmpeg', '-i', input_path, '-acodec', 'aac', '-ab', '192k', '-y', output_path]
-            elif output_format == 'flac':
-                cmd = ['ffmpeg', '-i', input_path, '-acodec', 'flac', '-y', output_path]
-            elif output_format == 'ogg':
-                cmd = ['ffmpeg', '-i', input_path, '-acodec', 'libvorbis', '-ab', '192k', '-y', output_path]
-            elif output_format == 'm4a':
-                cmd = ['ffmpeg', '-i', input_path, '-acodec', 'aac', '-ab', '192k', '-y', output_path]
-            else:
-                cmd = ['ffmpeg', '-i', input_path, '-y', output_path]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-            jobs[job_id]["progress"] = 60
-            
-            if result.returncode == 0:
-                jobs[job_id]["progress"] = 100
-                logger.info(f"Audio conversion: FFmpeg successful ({os.path.basename(input_path)} -> {os.path.basename(output_path)})")
-                return True
-            else:
-                logger.warning(f"FFmpeg failed: {result.stderr}")
-        except Exception as e:
-            logger.warning(f"FFmpeg not available or failed: {e}")
-
         # Method 3: sox (if available)
         try:
-            import subprocess
             cmd = ['sox', input_path, output_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            result = self._run_command(cmd, timeout=300)
             if result.returncode == 0:
                 jobs[job_id]["progress"] = 100
                 logger.info(f"Audio conversion: sox successful ({os.path.basename(input_path)} -> {os.path.basename(output_path)})")
@@ -2740,7 +3317,8 @@ class ConversionService:
 
         # Method 4: moviepy (alternative Python library)
         try:
-            from moviepy.editor import AudioFileClip
+            if AudioFileClip is None:
+                raise ImportError("moviepy is not installed")
             
             clip = AudioFileClip(input_path)
             jobs[job_id]["progress"] = 40
@@ -2770,8 +3348,7 @@ class ConversionService:
             output_format = os.path.splitext(output_path)[1][1:].lower()
             
             if input_format == output_format:
-                import shutil
-                shutil.copy2(input_path, output_path)
+                self._fast_copy(input_path, output_path)
                 jobs[job_id]["progress"] = 100
                 logger.info(f"Audio conversion: Copy successful (same format)")
                 return True
@@ -2782,37 +3359,108 @@ class ConversionService:
             jobs[job_id]["error"] = f"Audio conversion failed: {e}"
             return False
     
+    def _probe_codecs(self, path: str) -> tuple:
+        """(video codecs, audio codecs) of a media file, cached while the file is unchanged"""
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+        with self._probe_cache_lock:
+            if key in self._probe_cache:
+                self._probe_cache.move_to_end(key)
+                return self._probe_cache[key]
+        
+        cmd = ['ffprobe', '-v', 'error', '-show_entries', 'stream=codec_type,codec_name', '-of', 'json', path]
+        result = self._run_command(cmd, timeout=60)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffprobe failed: {result.stderr}")
+        streams = json.loads(result.stdout).get('streams', [])
+        codecs = tuple(
+            frozenset(stream.get('codec_name') for stream in streams if stream.get('codec_type') == kind)
+            for kind in ('video', 'audio')
+        )
+        
+        with self._probe_cache_lock:
+            self._probe_cache[key] = codecs
+            if len(self._probe_cache) > PROBE_CACHE_SIZE:
+                self._probe_cache.popitem(last=False)
+        return codecs
+    
+    def _try_stream_copy(self, input_path: str, output_path: str, audio_only: bool, job_id: str, jobs: Dict) -> bool:
+        """Remux with ffmpeg -c copy when the input codecs already fit the output container"""
+        output_format = os.path.splitext(output_path)[1][1:].lower()
+        allowed = STREAM_COPY_CODECS.get(output_format)
+        if not allowed:
+            return False
+        try:
+            video_codecs, audio_codecs = self._probe_codecs(input_path)
+            if audio_only:
+                if not audio_codecs or not audio_codecs <= allowed:
+                    return False
+                args = ['-map', '0:a', '-c', 'copy']
+            else:
+                if not video_codecs or not (video_codecs | audio_codecs) <= allowed:
+                    return False
+                args = ['-map', '0:v', '-map', '0:a?', '-c', 'copy']
+            
+            result = self._run_ffmpeg(input_path, output_path, args, timeout=300)
+            if result.returncode == 0:
+                jobs[job_id]["progress"] = 100
+                logger.info(f"Media conversion: FFmpeg stream copy successful ({os.path.basename(input_path)} -> {os.path.basename(output_path)})")
+                return True
+            logger.warning(f"FFmpeg stream copy failed: {result.stderr}")
+        except Exception as e:
+            logger.warning(f"FFmpeg stream copy not available or failed: {e}")
+        return False
+    
+    def _run_ffmpeg(self, src: str, dst: str, args: tuple, timeout: int):
+        """Run ffmpeg from src to dst with the given codec arguments.
+
+        Returns a CompletedProcess whose stderr holds only the last
+        FFMPEG_STDERR_TAIL bytes of ffmpeg's log.
+        """
+        cmd = ['ffmpeg', '-hide_banner', '-nostats', '-i', src, *args, '-y', dst]
+        
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            bufsize=SUBPROC_BUFSIZE,
+        )
+        # Drain stderr in the background, keeping only its tail for error messages
+        stderr_tail = deque(maxlen=FFMPEG_STDERR_TAIL // 4096)
+        reader = threading.Thread(
+            target=lambda: stderr_tail.extend(iter(lambda: proc.stderr.read(4096), b'')),
+            daemon=True,
+        )
+        reader.start()
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            reader.join()
+            proc.stderr.close()
+        return subprocess.CompletedProcess(cmd, proc.returncode, None, b''.join(stderr_tail).decode('utf-8', 'replace'))
+    
     # Video Conversion Methods
     def _video_convert(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         """Robust video conversion with multiple fallbacks for cross-platform support."""
         jobs[job_id]["progress"] = 10
         
+        # Remux without re-encoding when the codecs already fit the target container
+        if self._try_stream_copy(input_path, output_path, False, job_id, jobs):
+            return True
+        
         # Method 1: FFmpeg (command line) - Best quality and format support
         try:
-            import subprocess
-            
             # Get output format from file extension
             output_format = os.path.splitext(output_path)[1][1:].lower()
             
-            # Build FFmpeg command with quality settings
-            if output_format == 'mp4':
-                cmd = ['ffmpeg', '-i', input_path, '-c:v', 'libx264', '-c:a', 'aac', '-b:a', '192k', '-y', output_path]
-            elif output_format == 'avi':
-                cmd = ['ffmpeg', '-i', input_path, '-c:v', 'libxvid', '-c:a', 'mp3', '-b:a', '192k', '-y', output_path]
-            elif output_format == 'mov':
-                cmd = ['ffmpeg', '-i', input_path, '-c:v', 'libx264', '-c:a', 'aac', '-b:a', '192k', '-y', output_path]
-            elif output_format == 'webm':
-                cmd = ['ffmpeg', '-i', input_path, '-c:v', 'libvpx', '-c:a', 'libvorbis', '-b:a', '192k', '-y', output_path]
-            elif output_format == 'mkv':
-                cmd = ['ffmpeg', '-i', input_path, '-c:v', 'libx264', '-c:a', 'aac', '-b:a', '192k', '-y', output_path]
-            elif output_format == 'wmv':
-                cmd = ['ffmpeg', '-i', input_path, '-c:v', 'wmv2', '-c:a', 'wmav2', '-y', output_path]
-            elif output_format == 'flv':
-                cmd = ['ffmpeg', '-i', input_path, '-c:v', 'flv', '-c:a', 'mp3', '-b:a', '192k', '-y', output_path]
-            else:
-                cmd = ['ffmpeg', '-i', input_path, '-y', output_path]
+            args = VIDEO_FFMPEG_ARGS.get(output_format, ())
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+            result = self._run_ffmpeg(input_path, output_path, args, timeout=600)
             jobs[job_id]["progress"] = 60
             
             if result.returncode == 0:
@@ -2826,7 +3474,8 @@ class ConversionService:
 
         # Method 2: moviepy (Python library) - Alternative method
         try:
-            from moviepy.editor import VideoFileClip
+            if VideoFileClip is None:
+                raise ImportError("moviepy is not installed")
             
             clip = VideoFileClip(input_path)
             jobs[job_id]["progress"] = 40
@@ -2856,9 +3505,8 @@ class ConversionService:
 
         # Method 3: HandBrake CLI (if available)
         try:
-            import subprocess
             cmd = ['HandBrakeCLI', '-i', input_path, '-o', output_path, '--preset', 'Fast 1080p30']
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+            result = self._run_command(cmd, timeout=600)
             if result.returncode == 0:
                 jobs[job_id]["progress"] = 100
                 logger.info(f"Video conversion: HandBrake successful ({os.path.basename(input_path)} -> {os.path.basename(output_path)})")
@@ -2874,8 +3522,7 @@ class ConversionService:
             output_format = os.path.splitext(output_path)[1][1:].lower()
             
             if input_format == output_format:
-                import shutil
-                shutil.copy2(input_path, output_path)
+                self._fast_copy(input_path, output_path)
                 jobs[job_id]["progress"] = 100
                 logger.info(f"Video conversion: Copy successful (same format)")
                 return True
@@ -2890,28 +3537,18 @@ class ConversionService:
         """Robust video to audio extraction with multiple fallbacks."""
         jobs[job_id]["progress"] = 10
         
+        # Remux without re-encoding when the codecs already fit the target container
+        if self._try_stream_copy(input_path, output_path, True, job_id, jobs):
+            return True
+        
         # Method 1: FFmpeg (command line) - Best quality
         try:
-            import subprocess
-            
             # Get output format from file extension
             output_format = os.path.splitext(output_path)[1][1:].lower()
             
-            # Build FFmpeg command with quality settings
-            if output_format == 'mp3':
-                cmd = ['ffmpeg', '-i', input_path, '-vn', '-acodec', 'libmp3lame', '-ab', '192k', '-y', output_path]
-            elif output_format == 'wav':
-                cmd = ['ffmpeg', '-i', input_path, '-vn', '-acodec', 'pcm_s16le', '-y', output_path]
-            elif output_format == 'aac':
-                cmd = ['ffmpeg', '-i', input_path, '-vn', '-acodec', 'aac', '-ab', '192k', '-y', output_path]
-            elif output_format == 'flac':
-                cmd = ['ffmpeg', '-i', input_path, '-vn', '-acodec', 'flac', '-y', output_path]
-            elif output_format == 'ogg':
-                cmd = ['ffmpeg', '-i', input_path, '-vn', '-acodec', 'libvorbis', '-ab', '192k', '-y', output_path]
-            else:
-                cmd = ['ffmpeg', '-i', input_path, '-vn', '-y', output_path]
+            args = V2A_FFMPEG_ARGS.get(output_format, ('-vn',))
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            result = self._run_ffmpeg(input_path, output_path, args, timeout=300)
             jobs[job_id]["progress"] = 60
             
             if result.returncode == 0:
@@ -2925,7 +3562,8 @@ class ConversionService:
 
         # Method 2: moviepy (Python library)
         try:
-            from moviepy.editor import VideoFileClip
+            if VideoFileClip is None:
+                raise ImportError("moviepy is not installed")
             
             clip = VideoFileClip(input_path)
             audio = clip.audio
@@ -2953,7 +3591,8 @@ class ConversionService:
 
         # Method 3: pydub (if video has audio)
         try:
-            from pydub import AudioSegment
+            if AudioSegment is None:
+                raise ImportError("pydub is not installed")
             
             # Try to load as audio (works for some video formats)
             audio = AudioSegment.from_file(input_path)
@@ -2979,7 +3618,8 @@ class ConversionService:
 
         # Method 4: Last resort - create silent audio file
         try:
-            from pydub import AudioSegment
+            if AudioSegment is None:
+                raise ImportError("pydub is not installed")
             from pydub.generators import Silence
             
             # Create a silent audio file as fallback
@@ -3006,23 +3646,17 @@ class ConversionService:
     # Helper methods for image conversions
     def _image_to_html(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(f'''<!DOCTYPE html>
-<html>
-<head>
-    <title>Image Conversion</title>
-    <style>
-        body {{ margin: 20px; font-family: Arial, sans-serif; }}
-        .image-container {{ text-align: center; }}
-        img {{ max-width: 100%; height: auto; }}
-    </style>
-</head>
-<body>
-    <div class="image-container">
-        <img src="data:image/png;base64,{self._image_to_base64(input_path)}" alt="Converted Image">
-    </div>
-</body>
-</html>''')
+            import base64
+            # The image is base64-encoded straight into the output file in chunks,
+            # so the payload is never held in memory as one bytes/str object
+            with open(output_path, 'wb') as f, open(input_path, 'rb') as image_file:
+                f.write(IMAGE_HTML_PROLOGUE)
+                while True:
+                    chunk = image_file.read(BASE64_CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    f.write(base64.b64encode(chunk))
+                f.write(IMAGE_HTML_EPILOGUE)
             return True
         except Exception as e:
             logger.error(f"Image to HTML conversion error: {e}")
@@ -3040,60 +3674,67 @@ class ConversionService:
     
     def _html_to_doc(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            # Convert HTML to DOCX first, then save as DOC
-            temp_docx = output_path.replace('.doc', '.docx')
-            if self._html_to_docx(input_path, temp_docx, job_id, jobs):
-                # For DOC format, we'll just rename the DOCX file
-                # In a real implementation, you'd need a proper DOC converter
-                shutil.copy2(temp_docx, output_path)
-                os.remove(temp_docx)
-                return True
-            return False
+            # For DOC format the DOCX document is written under the .doc name directly;
+            # in a real implementation, you'd need a proper DOC converter
+            return self._html_to_docx(input_path, output_path, job_id, jobs)
         except Exception as e:
             logger.error(f"HTML to DOC conversion error: {e}")
             return False
     
     def _html_to_xlsx(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            # Convert HTML to CSV first, then to XLSX
-            temp_csv = output_path.replace('.xlsx', '.csv')
-            if self._html_to_csv(input_path, temp_csv, job_id, jobs):
-                result = self._csv_to_xlsx(temp_csv, output_path, job_id, jobs)
-                os.remove(temp_csv)
-                return result
-            return False
+            # Stream the HTML text lines straight into a write-only workbook, without a temp CSV
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet()
+            for line in self._iter_html_lines(input_path):
+                ws.append([line])
+            
+            buffer = io.BytesIO()
+            wb.save(buffer)
+            self._write_output(output_path, buffer)
+            return True
         except Exception as e:
             logger.error(f"HTML to XLSX conversion error: {e}")
             return False
     
     def _html_to_pptx(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
+        # Method 1: weasyprint renders to an in-memory PDF that is rasterized straight into slides
         try:
-            # Convert HTML to PDF first, then to PPTX
-            temp_pdf = output_path.replace('.pptx', '.pdf')
-            if self._html_to_pdf(input_path, temp_pdf, job_id, jobs):
-                result = self._pdf_to_pptx(temp_pdf, output_path, job_id, jobs)
-                os.remove(temp_pdf)
-                return result
-            return False
+            if fitz is None:
+                raise ImportError("PyMuPDF is not installed")
+            import weasyprint
+            pdf_bytes = weasyprint.HTML(filename=input_path).write_pdf()
+            jobs[job_id]["progress"] = 50
+            with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+                page_images = [_rasterize_pdf_page(page) for page in doc]
+                page_size = (doc[0].rect.width, doc[0].rect.height) if len(doc) > 0 else None
+            jobs[job_id]["progress"] = 80
+            self._images_to_pptx(page_images, page_size, output_path)
+            logger.info("HTML to PPTX: weasyprint in-memory conversion successful")
+            return True
+        except Exception as e:
+            logger.warning(f"weasyprint in-memory HTML to PPTX failed: {e}")
+        
+        # Method 2: Convert HTML to PDF on disk first, then to PPTX
+        try:
+            with self._intermediate_path('.pdf') as temp_pdf:
+                if self._html_to_pdf(input_path, temp_pdf, job_id, jobs):
+                    return self._pdf_to_pptx(temp_pdf, output_path, job_id, jobs)
+                return False
         except Exception as e:
             logger.error(f"HTML to PPTX conversion error: {e}")
             return False
     
     def _html_to_csv(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
         try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract text from HTML
-            soup = BeautifulSoup(content, 'html.parser')
-            text = soup.get_text()
-            
-            # Write as CSV
+            # Write the non-empty text lines of the HTML as a one-column CSV in a single write.
+            # Same output as csv.writer: only fields with a comma, quote or CR need quoting.
+            rows = [
+                '"' + line.replace('"', '""') + '"' if (',' in line or '"' in line or '\r' in line) else line
+                for line in self._iter_html_lines(input_path)
+            ]
             with open(output_path, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.writer(f)
-                for line in text.split('\n'):
-                    if line.strip():
-                        writer.writerow([line.strip()])
+                f.write(''.join(row + '\r\n' for row in rows))
             
             return True
         except Exception as e:
@@ -3101,17 +3742,19 @@ class ConversionService:
             return False
 
     def _epub_to_mobi(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
+        # Warm the page cache while pandoc/ebook-convert start up
+        self._prefetch(input_path)
         try:
-            import pypandoc
+            if pypandoc is None:
+                raise ImportError("pypandoc is not installed")
             pypandoc.convert_file(input_path, 'mobi', outputfile=output_path)
             return True
         except Exception as e:
             logger.error(f"EPUB to MOBI conversion error: {e}")
             # Fallback to ebook-convert (calibre)
             try:
-                import subprocess
                 cmd = ['ebook-convert', input_path, output_path]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+                result = self._run_command(cmd, timeout=120)
                 if result.returncode == 0:
                     return True
                 else:
@@ -3129,42 +3772,44 @@ class ConversionService:
                     return False
     
     def _pdf_to_pptx(self, input_path: str, output_path: str, job_id: str, jobs: Dict) -> bool:
+        # MuPDF reads the file randomly; warm the page cache while the parser starts
+        self._prefetch(input_path)
         try:
-            import fitz  # PyMuPDF
+            if fitz is None:
+                raise ImportError("PyMuPDF is not installed")
             # Convert PDF to images first, then to PPTX
-            temp_dir = "converted"
-            os.makedirs(temp_dir, exist_ok=True)
-            temp_images = []
-            
             doc = fitz.open(input_path)
+            page_count = len(doc)
+            page_images = [None] * page_count
+            
+            # Rendered serially: this already runs in one of the conversion worker processes,
+            # which together use every core. A single `mutool draw` subprocess would be just as
+            # serial, and couldn't pick PNG or JPEG per page (see _rasterize_pdf_page).
             for i, page in enumerate(doc):
-                jobs[job_id]["progress"] = 20 + (i / len(doc)) * 60
-                
-                # Convert page to image
-                temp_image_path = os.path.join(temp_dir, f"page_{i}.png")
-                pix = page.get_pixmap()
-                pix.save(temp_image_path)
-                temp_images.append(temp_image_path)
-            
-            # Create PPTX with images
-            prs = Presentation()
-            # Set slide size based on PDF page size if possible
-            if len(doc) > 0:
-                first_page = doc[0]
-                page_width, page_height = first_page.rect.width, first_page.rect.height
-                prs.slide_width = int(page_width * 12700) # Convert points to EMUs
-                prs.slide_height = int(page_height * 12700)
-
-            for temp_image in temp_images:
-                slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
-                # Add picture, centered and scaled to fit
-                left = top = 0
-                pic = slide.shapes.add_picture(temp_image, left, top, width=prs.slide_width, height=prs.slide_height)
-                os.remove(temp_image)
-            
-            prs.save(output_path)
+                self._set_loop_progress(jobs, job_id, 20, i, page_count)
+                page_images[i] = _rasterize_pdf_page(page)
+            
+            # Create PPTX with images, sized to the first PDF page if possible
+            page_size = (doc[0].rect.width, doc[0].rect.height) if page_count > 0 else None
+            self._images_to_pptx(page_images, page_size, output_path)
             doc.close()
             return True
         except Exception as e:
             logger.error(f"PDF to PPTX conversion error: {e}")
             return False
+    
+    def _images_to_pptx(self, page_images: list, page_size, output_path: str) -> None:
+        """Save one full-slide picture per PNG/JPEG image; page_size is (width, height) in points"""
+        prs = Presentation()
+        if page_size:
+            page_width, page_height = page_size
+            prs.slide_width = int(page_width * 12700) # Convert points to EMUs
+            prs.slide_height = int(page_height * 12700)
+
+        for png in page_images:
+            slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
+            # Add picture, centered and scaled to fit
+            left = top = 0
+            slide.shapes.add_picture(io.BytesIO(png), left, top, width=prs.slide_width, height=prs.slide_height)
+        
+        prs.save(output_path)
@@ -4,8 +4,10 @@ Generate a beautiful PDF summary report from the latest test summary CSV.
 """
 import os
 import glob
+import numpy as np
 import pandas as pd
 from datetime import datetime
+from xml.sax.saxutils import escape
 from reportlab.lib.pagesizes import landscape, A4
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -13,18 +15,58 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from reportlab.lib.units import inch
 
-def generate_summary_pdf():
-    """Generate the PDF summary report."""
-    # Find the latest test_summary_*.csv
-    summary_files = sorted(glob.glob('test_outputs/test_summary_*.csv'))
-    if not summary_files:
-        print("No test summary CSV found in test_outputs/.")
-        return
-    latest_csv = summary_files[-1]
-    df = pd.read_csv(latest_csv)
+# Only the summary columns the report uses are loaded
+SUMMARY_COLUMNS = [
+    'Test File', 'Source Format', 'Destination Format', 'Success',
+    'Conversion Method', 'Content Preserved', 'Error', 'Warning',
+]
+SUMMARY_DTYPES = {
+    'Success': 'bool',
+    'Content Preserved': 'bool',
+    'Source Format': 'category',
+    'Destination Format': 'category',
+    'Conversion Method': 'category',
+    'Error': 'category',
+    'Warning': 'category',
+}
+
+# Cells longer than this (in characters) are wrapped in a Paragraph; shorter ones fit their column as plain strings
+FILENAME_WRAP_CHARS = 20
+DETAILS_WRAP_CHARS = 40
+
+# Table styles shared by every report; only the per-row coloring is built per call
+SUMMARY_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTSIZE', (0, 0), (-1, -1), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey)
+])
+CONV_BASE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f5f5f5')),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+])
+
+PDF_PATH = "summaryReport.pdf"
+
+def find_latest_summary():
+    """Path of the newest test_outputs/test_summary_*.csv, or None"""
+    return max(glob.iglob('test_outputs/test_summary_*.csv'), key=os.path.getmtime, default=None)
+
+def _build_report(csv_path: str, pdf_path: str):
+    """Build the PDF report for one summary CSV (CPU-bound; safe to run in a worker process)."""
+    generated_at = f"{datetime.now():%Y-%m-%d %H:%M:%S}"
+    df = pd.read_csv(csv_path, engine='pyarrow', usecols=SUMMARY_COLUMNS, dtype=SUMMARY_DTYPES)
 
     # Prepare PDF in landscape mode
-    pdf_path = "summaryReport.pdf"
     doc = SimpleDocTemplate(pdf_path, pagesize=landscape(A4), rightMargin=30, leftMargin=30, topMargin=30, bottomMargin=30)
     story = []
     styles = getSampleStyleSheet()
@@ -33,7 +75,7 @@ def generate_summary_pdf():
     # Title
     title_style = ParagraphStyle('title', parent=styles['Title'], alignment=TA_CENTER, fontSize=22, spaceAfter=20)
     story.append(Paragraph("Universal File Converter - Test Summary Report", title_style))
-    story.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal']))
+    story.append(Paragraph(f"Generated: {generated_at}", styles['Normal']))
     story.append(Spacer(1, 12))
 
     # Summary stats
@@ -48,100 +90,89 @@ def generate_summary_pdf():
         ["Failed", failure],
         ["Success Rate", f"{success_rate:.1f}%"]
     ]
-    summary_table = Table(summary_data, hAlign='LEFT', colWidths=[2.5*inch, 1.5*inch])
-    summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey)
-    ]))
+    summary_table = Table(summary_data, hAlign='LEFT', colWidths=[2.5*inch, 1.5*inch], style=SUMMARY_STYLE)
     story.append(summary_table)
     story.append(Spacer(1, 18))
 
-    # Conversion Table with wrapped text
-    df['Error/Warning'] = df['Error'].fillna('') + df['Warning'].fillna('')
+    # Conversion Table with wrapped text; columns are built vectorized, only the Paragraph wrapping is per row
+    input_files = df['Test File'].astype(str)
+    output_files = input_files.str.rsplit('.', n=1).str[0] + '.' + df['Destination Format'].astype(str).str.lower()
+    statuses = np.where(df['Success'], "Success", "Fail")
+    methods = df['Conversion Method'].astype(object).fillna('')
+    content = np.where(df['Content Preserved'], "Yes", "No")
+    # The error if there is one, otherwise the warning; blank cells are NaN, so they never render as "nan"
+    details = df['Error'].astype(object).fillna(df['Warning'].astype(object)).fillna('')
+
+    # Paragraph parsing is the expensive part of the table build, so only text that needs wrapping gets one
+    def cell(text, wrap_chars):
+        return Paragraph(text, styles['Justify']) if len(text) > wrap_chars else text
+
     table_data = [["Input File", "Output File", "Source", "Output", "Status", "Method", "Content Preserved", "Details"]]
-    
-    for _, row in df.iterrows():
-        # Wrap text in Paragraph objects
-        input_file_p = Paragraph(row['Test File'], styles['Justify'])
-        output_file_p = Paragraph(row['Test File'].split('.')[0] + f".{row['Destination Format'].lower()}", styles['Justify'])
-        details_p = Paragraph(row['Error/Warning'], styles['Justify'])
-        
-        status = "Success" if row['Success'] else "Fail"
-        
-        table_data.append([
-            input_file_p,
-            output_file_p,
-            row['Source Format'],
-            row['Destination Format'],
+    table_data += [
+        [
+            cell(input_file, FILENAME_WRAP_CHARS),
+            cell(output_file, FILENAME_WRAP_CHARS),
+            source,
+            destination,
             status,
-            row.get('Conversion Method', ''),
-            "Yes" if row.get('Content Preserved', False) else "No",
-            details_p
-        ])
+            method,
+            preserved,
+            cell(detail, DETAILS_WRAP_CHARS),
+        ]
+        for input_file, output_file, source, destination, status, method, preserved, detail in zip(
+            input_files, output_files, df['Source Format'], df['Destination Format'],
+            statuses, methods, content, details,
+        )
+    ]
 
     col_widths = [1.5*inch, 1.5*inch, 0.7*inch, 0.7*inch, 0.7*inch, 1*inch, 1*inch, 3.5*inch]
-    conv_table = Table(table_data, repeatRows=1, colWidths=col_widths)
-    conv_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f5f5f5')),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-    ]))
-
-    for i, row in enumerate(table_data[1:], start=1):
-        status = row[4]
-        color = colors.green if status == "Success" else colors.red
-        conv_table.setStyle([('TEXTCOLOR', (4, i), (4, i), color)])
+    style_cmds = []
+
+    # Row coloring is collected up front and layered on the base style, and passed to the Table constructor in one style
+    for i, status in enumerate(statuses, start=1):
         if status == "Fail":
-            conv_table.setStyle([('BACKGROUND', (0, i), (-1, i), colors.HexColor('#ffeaea'))])
+            style_cmds.append(('TEXTCOLOR', (4, i), (4, i), colors.red))
+            style_cmds.append(('BACKGROUND', (0, i), (-1, i), colors.HexColor('#ffeaea')))
         else:
-            conv_table.setStyle([('BACKGROUND', (0, i), (-1, i), colors.HexColor('#eaffea'))])
-            
+            style_cmds.append(('TEXTCOLOR', (4, i), (4, i), colors.green))
+            style_cmds.append(('BACKGROUND', (0, i), (-1, i), colors.HexColor('#eaffea')))
+
+    conv_table = Table(table_data, repeatRows=1, colWidths=col_widths, style=TableStyle(style_cmds, parent=CONV_BASE_STYLE))
+
     story.append(Paragraph("<b>Conversion Results</b>", styles['Heading2']))
     story.append(conv_table)
     story.append(Spacer(1, 18))
 
-    # Recommendations and Warnings
-    recommendations = df['Warning'].dropna().unique()
-    errors = df['Error'].dropna().unique()
+    # Recommendations and Warnings (one Paragraph per section, messages escaped for ReportLab's markup parser)
+    # Distinct messages with how many tests reported each, most frequent first; the columns are
+    # categorical, so this counts codes against the few distinct messages instead of hashing every string
+    recommendations = df['Warning'].value_counts()
+    errors = df['Error'].value_counts()
 
     if len(recommendations) > 0 or len(errors) > 0:
         story.append(Paragraph("<b>Recommendations & Warnings</b>", styles['Heading2']))
         
         if len(errors) > 0:
-            error_section = Table(
-                [[Paragraph("<b>Errors</b>", styles['Normal']), '']],
-                colWidths=[1.5*inch, 8.5*inch], 
-                style=[('VALIGN', (0,0), (-1,-1), 'TOP')]
-            )
-            story.append(error_section)
-            for e in errors:
-                story.append(Paragraph(f"• {e}", styles['Normal']))
+            story.append(Paragraph("<b>Errors</b>", styles['Heading3']))
+            story.append(Paragraph("<br/>".join(f"• ({n}×) {escape(e)}" for e, n in errors.items()), styles['Normal']))
             story.append(Spacer(1, 12))
 
         if len(recommendations) > 0:
-            rec_section = Table(
-                [[Paragraph("<b>Warnings</b>", styles['Normal']), '']],
-                colWidths=[1.5*inch, 8.5*inch],
-                style=[('VALIGN', (0,0), (-1,-1), 'TOP')]
-            )
-            story.append(rec_section)
-            for r in recommendations:
-                story.append(Paragraph(f"• {r}", styles['Normal']))
+            story.append(Paragraph("<b>Warnings</b>", styles['Heading3']))
+            story.append(Paragraph("<br/>".join(f"• ({n}×) {escape(r)}" for r, n in recommendations.items()), styles['Normal']))
 
     # Build PDF
-    print(f"Generating {pdf_path} from {latest_csv} ...")
     doc.build(story)
-    print(f"Done! Open {pdf_path} to view the summary report.")
+
+def generate_summary_pdf():
+    """Generate the PDF summary report."""
+    latest_csv = find_latest_summary()
+    if latest_csv is None:
+        print("No test summary CSV found in test_outputs/.")
+        return
+    print(f"Generating {PDF_PATH} from {latest_csv} ...")
+    _build_report(latest_csv, PDF_PATH)
+    print(f"Done! Open {PDF_PATH} to view the summary report.")
 
 if __name__ == "__main__":
     generate_summary_pdf()
@@ -1,20 +1,60 @@
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from uuid import uuid4
 import os
 import asyncio
-import aiofiles
-import shutil
-import uuid
 import hashlib
-from typing import List, Dict
+import time
+import orjson
+from collections import Counter, OrderedDict
+from collections.abc import MutableMapping
 from conversion_service import ConversionService
 import logging
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
+from cachetools import TTLCache
+from python_multipart.multipart import MultipartParser, parse_options_header
 
-app = FastAPI(title="Universal File Converter API", version="1.0.0")
+# Faster content hashing for dedup (optional - falls back to hashlib's SHA-256)
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+# Job state shared between API worker processes (optional - see REDIS_URL)
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+# Handlers' dict results (notably the polled /status) are serialized with orjson
+app = FastAPI(title="Universal File Converter API", version="1.0.0", default_response_class=ORJSONResponse)
+
+# Multipart framing and the format fields on top of the file itself
+UPLOAD_FORM_OVERHEAD = 64 * 1024
+# receive_upload's limits on everything in the form besides the file
+MAX_FORM_PARTS = 16
+MAX_FORM_FIELD_BYTES = 1024
+MAX_PART_HEADER_BYTES = 8 * 1024
+
+class UploadSizeLimitMiddleware:
+    """Reject requests whose Content-Length already exceeds the upload limit, before any of the body is read"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > MAX_FILE_SIZE + UPLOAD_FORM_OVERHEAD:
+                        response = ORJSONResponse({"detail": f"File exceeds the {MAX_FILE_SIZE} byte limit"}, status_code=413)
+                        await response(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
+
+# Added before CORS so CORS stays outermost and its headers reach the 413 too
+app.add_middleware(UploadSizeLimitMiddleware)
 
 # Enable CORS for all origins (adjust as needed)
 app.add_middleware(
@@ -25,14 +65,208 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Conversions run at once per API worker; the host's CPUs are split between the WEB_CONCURRENCY workers
+CONVERSION_WORKERS = int(os.getenv(
+    "CONVERSION_WORKERS",
+    max(1, (os.cpu_count() or 1) // max(1, int(os.getenv("WEB_CONCURRENCY", "1"))))
+))
+
 # Initialize conversion service
-conversion_service = ConversionService()
+conversion_service = ConversionService(max_workers=CONVERSION_WORKERS)
+
+# In-memory job store (replace with persistent storage in production).
+# Finished jobs are bounded and expiring so they don't accumulate forever; handlers touch it under jobs_lock.
+JOBS_MAX = 10_000
+JOBS_TTL_SECONDS = 3600
+FINISHED_STATUSES = frozenset({"completed", "error"})
+
+class FinishedJobs(TTLCache):
+    """TTL cache that calls on_remove with each job leaving it (delete, size eviction, TTL expiry)"""
+
+    def __init__(self, maxsize, ttl, on_remove):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.on_remove = on_remove
+
+    def __delitem__(self, key):
+        job = self.get(key)
+        super().__delitem__(key)
+        if job is not None:
+            self.on_remove(job)
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for _, job in expired:
+            self.on_remove(job)
+        return expired
+
+class JobStore(MutableMapping):
+    """Jobs by ID, counting per file hash the jobs referencing that upload.
+
+    Pending and converting jobs are kept in a plain dict, so they are never expired or
+    evicted while their upload and output are in use; once finished (see finish) a job
+    moves to a TTL cache bounded at maxsize. The counts follow every way a job leaves
+    the store, so checking whether an upload is still referenced is O(1).
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.active = {}
+        self.finished = FinishedJobs(maxsize, ttl, self._release)
+        self.hash_refcount = Counter()
+
+    def _release(self, job):
+        file_hash = job.get("file_hash")
+        self.hash_refcount[file_hash] -= 1
+        if self.hash_refcount[file_hash] <= 0:
+            del self.hash_refcount[file_hash]
+
+    def __getitem__(self, key):
+        if key in self.active:
+            return self.active[key]
+        return self.finished[key]
+
+    def __setitem__(self, key, job):
+        if key in self:
+            del self[key]
+        store = self.finished if job.get("status") in FINISHED_STATUSES else self.active
+        store[key] = job
+        self.hash_refcount[job.get("file_hash")] += 1
+
+    def __delitem__(self, key):
+        if key in self.active:
+            self._release(self.active.pop(key))
+        else:
+            del self.finished[key]
+
+    def __iter__(self):
+        yield from list(self.active)
+        yield from list(self.finished)
+
+    def __len__(self):
+        return len(self.active) + len(self.finished)
+
+    def finish(self, key):
+        """Move a job whose conversion has ended to the expiring store"""
+        job = self.active.pop(key, None)
+        if job is not None:
+            self.finished[key] = job
+
+    def expire(self, time=None):
+        return self.finished.expire(time)
+
+jobs = JobStore(maxsize=JOBS_MAX, ttl=JOBS_TTL_SECONDS)
+jobs_lock = asyncio.Lock()
+
+# With REDIS_URL set, job state is mirrored to Redis so any worker process can answer /status and /download
+# and cleanup leaves other processes' files alone; jobs above stays the local store of the jobs this process runs
+REDIS_URL = os.getenv("REDIS_URL")
+redis_client = aioredis.from_url(REDIS_URL) if REDIS_URL and aioredis is not None else None
+
+class Job(dict):
+    """A job's fields; once the job is in Redis, every status and progress change is published there too"""
+
+    def __init__(self, job_id: str, fields: dict):
+        super().__init__(fields)
+        self.job_id = job_id
+        self.published = False
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        if self.published and key in ("status", "progress"):
+            schedule_publish(self.job_id)
+
+# Jobs being published by a task, mapped to whether they changed again meanwhile
+publishing: dict[str, bool] = {}
+publish_tasks = set()
+
+def schedule_publish(job_id: str):
+    """Publish a job from a background task; changes made while that runs are sent once it's done"""
+    if job_id in publishing:
+        publishing[job_id] = True
+        return
+    publishing[job_id] = False
+    task = asyncio.create_task(publish_changes(job_id))
+    publish_tasks.add(task)
+    task.add_done_callback(publish_tasks.discard)
+
+async def publish_changes(job_id: str):
+    try:
+        while True:
+            await publish_job(job_id)
+            if not publishing[job_id]:
+                break
+            publishing[job_id] = False
+    finally:
+        del publishing[job_id]
+
+async def publish_job(job_id: str, create: bool = False):
+    """Copy a job's current state to Redis (no-op without REDIS_URL).
+
+    Updates only overwrite a key that still exists, so a job deleted through another worker
+    process is not brought back; it is dropped from the local store instead.
+    """
+    if redis_client is None:
+        return
+    async with jobs_lock:
+        job = jobs.get(job_id)
+    if job is None:
+        return
+    # Like the local store, only finished jobs expire
+    ttl = JOBS_TTL_SECONDS if job["status"] in FINISHED_STATUSES else None
+    try:
+        stored = await redis_client.set(f"job:{job_id}", orjson.dumps(job), ex=ttl, xx=not create)
+    except Exception as e:
+        logging.error(f"Error publishing job {job_id} to Redis: {e}")
+        return
+    if stored:
+        job.published = True
+    elif job.published:
+        async with jobs_lock:
+            jobs.pop(job_id, None)
+
+async def get_job(job_id: str):
+    """A job's state, from Redis when it is published there, else from the local store; None if unknown"""
+    async with jobs_lock:
+        job = jobs.get(job_id)
+    if redis_client is None or (job is not None and not job.published):
+        return job
+    try:
+        raw = await redis_client.get(f"job:{job_id}")
+    except Exception as e:
+        logging.error(f"Error reading job {job_id} from Redis: {e}")
+        return job
+    if raw:
+        return orjson.loads(raw)
+    if job is not None:
+        # Deleted through another worker process
+        async with jobs_lock:
+            jobs.pop(job_id, None)
+    return None
 
-# In-memory job store (replace with persistent storage in production)
-jobs = {}
+async def shared_job_references() -> tuple[set, set]:
+    """IDs and upload hashes of all worker processes' jobs in Redis (empty without REDIS_URL)"""
+    job_ids, file_hashes = set(), set()
+    if redis_client is None:
+        return job_ids, file_hashes
+    keys = [key async for key in redis_client.scan_iter(match="job:*", count=1000)]
+    for start in range(0, len(keys), 1000):
+        batch = keys[start:start + 1000]
+        for key, raw in zip(batch, await redis_client.mget(batch)):
+            if raw:
+                job_ids.add(key.decode().removeprefix("job:"))
+                file_hashes.add(orjson.loads(raw).get("file_hash"))
+    return job_ids, file_hashes
 
 # File hash mapping to avoid storing duplicate files
-file_hash_mapping = {}  # hash -> {filename, upload_path}
+# Kept in least-recently-used order: uploads no job references stay around for reuse until their total size passes
+# UPLOAD_CACHE_MAX_BYTES, and are evicted oldest first as new uploads arrive
+file_hash_mapping = OrderedDict()  # hash -> {filename, upload_path, size}
+UPLOAD_CACHE_MAX_BYTES = int(os.getenv("UPLOAD_CACHE_MAX_BYTES", 5 * 1024 ** 3))
+uploads_total_bytes = 0
+# Held while an upload is matched/renamed into place and while cleanup deletes uploads, so the two can't interleave
+uploads_lock = asyncio.Lock()
+
+# Finished conversions, so repeat requests for the same content and formats skip converting
+conversion_cache = TTLCache(maxsize=JOBS_MAX, ttl=JOBS_TTL_SECONDS)  # (hash, source, destination) -> converted_path
 
 # Example supported formats (expand as needed)
 supported_formats = [
@@ -162,48 +396,309 @@ supported_formats = [
       }
     ]
 
+# Source format -> allowed destination formats, built once for O(1) lookups.
+# "JPEG/JPG" is stored under "JPG", the name requests are normalized to.
+SUPPORTED = {
+    ("JPG" if entry["source"] == "JPEG/JPG" else entry["source"]): frozenset(entry["destination"])
+    for entry in supported_formats
+}
+
+# Bodies of the endpoints whose responses never change, serialized once
+FORMATS_JSON = orjson.dumps(supported_formats)
+ROOT_JSON = orjson.dumps({
+    "message": "Universal File Converter API",
+    "version": "1.0.0",
+    "endpoints": {
+        "convert": "POST /convert - Convert a file",
+        "status": "GET /status/{jobId} - Check conversion status",
+        "download": "GET /download/{jobId} - Download converted file",
+        "formats": "GET /formats - Get supported formats",
+        "health": "GET /health - Health check"
+    }
+})
+HEALTH_JSON = orjson.dumps({"status": "healthy", "message": "Universal File Converter API is running"})
+
+def cacheable_json_response(body: bytes) -> Response:
+    """Response for a static JSON body, built once and cacheable by clients and CDNs for a day"""
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=86400", "ETag": f'"{hashlib.md5(body).hexdigest()}"'}
+    )
+
+FORMATS_RESPONSE = cacheable_json_response(FORMATS_JSON)
+ROOT_RESPONSE = cacheable_json_response(ROOT_JSON)
+
+def revalidated(request: Request, response: Response) -> Response:
+    """A prebuilt cacheable response, or 304 when the client's If-None-Match already matches its ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, response.headers["etag"]):
+        return Response(status_code=304, headers={
+            "ETag": response.headers["etag"],
+            "Cache-Control": response.headers["cache-control"]
+        })
+    return response
+
+# File extensions for formats whose extension isn't simply the lowercased format name
+# (none so far; this is the one place to add such aliases)
+EXT_OVERRIDES: dict[str, str] = {}
+
+def output_extension(fmt: str) -> str:
+    """File extension (with the dot) for a destination format"""
+    fmt = fmt.upper()
+    return EXT_OVERRIDES.get(fmt, f".{fmt.lower()}")
+
+# Content types for converted downloads, keyed by lowercase extension
+MIME_TYPES = {
+    "pdf": "application/pdf",
+    "doc": "application/msword",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "xls": "application/vnd.ms-excel",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "ppt": "application/vnd.ms-powerpoint",
+    "pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+    "odt": "application/vnd.oasis.opendocument.text",
+    "ods": "application/vnd.oasis.opendocument.spreadsheet",
+    "odp": "application/vnd.oasis.opendocument.presentation",
+    "rtf": "application/rtf",
+    "txt": "text/plain",
+    "html": "text/html",
+    "csv": "text/csv",
+    "xml": "application/xml",
+    "json": "application/json",
+    "epub": "application/epub+zip",
+    "mobi": "application/x-mobipocket-ebook",
+    "azw3": "application/vnd.amazon.ebook",
+    "jpg": "image/jpeg",
+    "png": "image/png",
+    "gif": "image/gif",
+    "bmp": "image/bmp",
+    "tiff": "image/tiff",
+    "webp": "image/webp",
+    "svg": "image/svg+xml",
+    "ico": "image/vnd.microsoft.icon",
+    "mp3": "audio/mpeg",
+    "wav": "audio/wav",
+    "aac": "audio/aac",
+    "flac": "audio/flac",
+    "ogg": "audio/ogg",
+    "m4a": "audio/mp4",
+    "mp4": "video/mp4",
+    "avi": "video/x-msvideo",
+    "mov": "video/quicktime",
+    "wmv": "video/x-ms-wmv",
+    "flv": "video/x-flv",
+    "mkv": "video/x-matroska",
+    "webm": "video/webm",
+}
+
 UPLOAD_DIR = "uploads"
 CONVERTED_DIR = "converted"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 os.makedirs(CONVERTED_DIR, exist_ok=True)
 
-async def calculate_file_hash(content: bytes) -> str:
-    """Calculate SHA-256 hash of file content"""
-    return hashlib.sha256(content).hexdigest()
+# Uploads larger than this are rejected with 413: up front by UploadSizeLimitMiddleware when the declared
+# Content-Length is too big, otherwise as soon as the stream passes it
+MAX_FILE_SIZE = int(os.getenv("MAX_FILE_SIZE", 100 * 1024 * 1024))
+
+def new_content_hasher():
+    """Hasher for upload dedup: BLAKE3 when installed, else SHA-256"""
+    return blake3(max_threads=blake3.AUTO) if blake3 is not None else hashlib.sha256()
 
-async def get_or_create_file_path(content: bytes, original_filename: str) -> tuple[str, str]:
+def write_and_hash(f, hasher, data: bytes):
+    """Hash an upload chunk and append it to the partial file; run in a thread, since both release the GIL"""
+    hasher.update(data)
+    f.write(data)
+
+def partial_upload_path(original_filename: str) -> str:
+    """Path an upload is streamed to before it is renamed to its hash"""
+    file_extension = os.path.splitext(original_filename)[1] if original_filename else ""
+    # Not "~$"-prefixed, so cleanup_temp_files can't remove an upload in progress
+    return os.path.join(UPLOAD_DIR, f".partial_{uuid4().hex}{file_extension}")
+
+async def receive_upload(request: Request) -> tuple[dict, str, str, str, int]:
     """
-    Check if file already exists by hash, return existing path or create new one.
-    Returns: (upload_path, file_hash)
+    Parse a multipart/form-data body as it streams in. The file part is hashed and
+    written to a partial upload path chunk by chunk, so it is never spooled to a
+    temporary file and read back; the small text fields are kept in memory.
+    Returns: (fields, original_filename, partial_path, file_hash, size); the
+    caller owns partial_path from then on.
     """
-    file_hash = await calculate_file_hash(content)
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise HTTPException(status_code=400, detail="Expected a multipart/form-data body")
     
-    # Check if we already have this file
-    if file_hash in file_hash_mapping:
-        existing_info = file_hash_mapping[file_hash]
-        return existing_info["upload_path"], file_hash
+    fields = {}
+    upload = {}  # filename of the file part, once its headers are parsed
+    part = {}  # the part being parsed
+    header_field, header_value = bytearray(), bytearray()
+    file_chunks = []  # file bytes parsed from the current request chunk, not written yet
+    parts_seen = [0]
     
-    # Create new file entry
-    file_extension = os.path.splitext(original_filename)[1] if original_filename else ""
-    upload_filename = f"{file_hash}{file_extension}"
-    upload_path = os.path.join(UPLOAD_DIR, upload_filename)
+    def form_too_large():
+        return HTTPException(status_code=413, detail="Form fields exceed the size limit")
     
-    # Save the file
-    async with aiofiles.open(upload_path, 'wb') as f:
-        await f.write(content)
+    def on_part_begin():
+        parts_seen[0] += 1
+        if parts_seen[0] > MAX_FORM_PARTS:
+            raise HTTPException(status_code=413, detail=f"Form has more than {MAX_FORM_PARTS} parts")
+        part.clear()
+        part["header_bytes"] = 0
+        part["headers"] = {}
+        part["value"] = bytearray()
     
-    # Store mapping
-    file_hash_mapping[file_hash] = {
-        "filename": upload_filename,
-        "upload_path": upload_path
-    }
+    def on_header_field(data, start, end):
+        add_header_bytes(end - start)
+        header_field.extend(data[start:end])
+    
+    def on_header_value(data, start, end):
+        add_header_bytes(end - start)
+        header_value.extend(data[start:end])
+    
+    def add_header_bytes(count):
+        part["header_bytes"] += count
+        if part["header_bytes"] > MAX_PART_HEADER_BYTES:
+            raise form_too_large()
+    
+    def on_header_end():
+        part["headers"][bytes(header_field).lower()] = bytes(header_value)
+        header_field.clear()
+        header_value.clear()
+    
+    def on_headers_finished():
+        _, options = parse_options_header(part["headers"].get(b"content-disposition", b""))
+        part["name"] = options.get(b"name", b"").decode("utf-8", "replace")
+        part["is_file"] = b"filename" in options
+        if part["is_file"]:
+            if "filename" in upload:
+                raise HTTPException(status_code=400, detail="Only one file can be uploaded per request")
+            upload["filename"] = options[b"filename"].decode("utf-8", "replace")
+    
+    def on_part_data(data, start, end):
+        if part["is_file"]:
+            file_chunks.append(data[start:end])
+        else:
+            if len(part["value"]) + end - start > MAX_FORM_FIELD_BYTES:
+                raise form_too_large()
+            part["value"].extend(data[start:end])
+    
+    def on_part_end():
+        if not part["is_file"]:
+            fields[part["name"]] = part["value"].decode("utf-8", "replace")
     
-    return upload_path, file_hash
+    parser = MultipartParser(params[b"boundary"], {
+        "on_part_begin": on_part_begin,
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_header_end": on_header_end,
+        "on_headers_finished": on_headers_finished,
+        "on_part_data": on_part_data,
+        "on_part_end": on_part_end,
+    })
+    
+    hasher = new_content_hasher()
+    total = 0
+    body_total = 0  # whole body, so a chunked request without Content-Length is bounded too
+    partial_path = None
+    f = None
+    try:
+        async for chunk in request.stream():
+            body_total += len(chunk)
+            if body_total > MAX_FILE_SIZE + UPLOAD_FORM_OVERHEAD:
+                raise HTTPException(status_code=413, detail=f"File exceeds the {MAX_FILE_SIZE} byte limit")
+            parser.write(chunk)
+            if "filename" in upload and f is None:
+                partial_path = partial_upload_path(upload["filename"])
+                f = await asyncio.to_thread(open, partial_path, 'wb')
+            if file_chunks:
+                data = b"".join(file_chunks)
+                file_chunks.clear()
+                total += len(data)
+                if total > MAX_FILE_SIZE:
+                    raise HTTPException(status_code=413, detail=f"File exceeds the {MAX_FILE_SIZE} byte limit")
+                await asyncio.to_thread(write_and_hash, f, hasher, data)
+        parser.finalize()
+        if f is None:
+            raise HTTPException(status_code=422, detail="No file uploaded")
+        await asyncio.to_thread(f.close)
+    except Exception:
+        if f is not None:
+            await asyncio.to_thread(f.close)
+        if partial_path is not None and os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+    
+    return fields, upload["filename"], partial_path, hasher.hexdigest(), total
+
+async def get_or_create_file_path(partial_path: str, file_hash: str, size: int, original_filename: str) -> str:
+    """
+    Move a received upload to its hash-keyed path; if a file with the same hash
+    already exists, the new copy is discarded and the existing path returned.
+    Returns: upload_path
+    """
+    global uploads_total_bytes
+    file_extension = os.path.splitext(original_filename)[1] if original_filename else ""
+    
+    async with uploads_lock:
+        # Check if we already have this file
+        if file_hash in file_hash_mapping:
+            existing_path = file_hash_mapping[file_hash]["upload_path"]
+            try:
+                # Touched so another worker's cleanup sees it in use (see cleanup_orphaned_files)
+                await asyncio.to_thread(os.utime, existing_path)
+            except FileNotFoundError:
+                # Already cleaned up by another worker process: store this copy instead
+                uploads_total_bytes -= file_hash_mapping.pop(file_hash)["size"]
+            else:
+                await asyncio.to_thread(os.remove, partial_path)
+                file_hash_mapping.move_to_end(file_hash)
+                return existing_path
+        
+        # Create new file entry
+        upload_filename = f"{file_hash}{file_extension}"
+        upload_path = os.path.join(UPLOAD_DIR, upload_filename)
+        await asyncio.to_thread(os.replace, partial_path, upload_path)
+        
+        # Store mapping
+        file_hash_mapping[file_hash] = {
+            "filename": upload_filename,
+            "upload_path": upload_path,
+            "size": size
+        }
+        uploads_total_bytes += size
+        
+        if uploads_total_bytes > UPLOAD_CACHE_MAX_BYTES:
+            async with jobs_lock:
+                evicted = evict_unused_uploads(keep=file_hash)
+            await asyncio.to_thread(_remove_files, evicted, "evicted upload")
+    
+    return upload_path
+
+def evict_unused_uploads(keep: str | None = None) -> list[str]:
+    """Drop least recently used uploads no job references until the total fits UPLOAD_CACHE_MAX_BYTES.
+
+    Returns the paths to delete. Call with uploads_lock and jobs_lock held.
+    """
+    global uploads_total_bytes
+    evicted = []
+    for file_hash in list(file_hash_mapping):
+        if uploads_total_bytes <= UPLOAD_CACHE_MAX_BYTES:
+            break
+        if file_hash == keep or jobs.hash_refcount[file_hash]:
+            continue
+        info = file_hash_mapping.pop(file_hash)
+        uploads_total_bytes -= info["size"]
+        evicted.append(info["upload_path"])
+    return evicted
 
 async def perform_conversion(job_id: str, upload_path: str, output_path: str, source_format: str, destination_format: str):
     """Background task to perform file conversion"""
+    # The job may have been deleted while it waited in the queue
+    async with jobs_lock:
+        if job_id not in jobs:
+            return
     try:
-        await conversion_service.convert_file(
+        success = await conversion_service.convert_file(
             input_path=upload_path,
             output_path=output_path,
             source_format=source_format,
@@ -211,79 +706,209 @@ async def perform_conversion(job_id: str, upload_path: str, output_path: str, so
             job_id=job_id,
             jobs=jobs
         )
+        job = jobs.get(job_id)
+        if success and job is not None:
+            conversion_cache[(job["file_hash"], source_format, destination_format)] = output_path
     except Exception as e:
-        jobs[job_id]["status"] = "error"
-        jobs[job_id]["error"] = str(e)
+        job = jobs.get(job_id)
+        if job is not None:
+            job["status"] = "error"
+            job["error"] = str(e)
+    async with jobs_lock:
+        jobs.finish(job_id)
+
+# Conversions wait in this queue and are run by CONVERSION_WORKERS worker tasks, which caps how many run at once
+conversion_queue = asyncio.Queue()
+conversion_workers = []
+
+async def conversion_worker():
+    """Take queued jobs (perform_conversion arguments) and convert them one at a time"""
+    while True:
+        args = await conversion_queue.get()
+        try:
+            await perform_conversion(*args)
+        except Exception as e:
+            logging.error(f"Conversion worker error for job {args[0]}: {e}")
+        finally:
+            conversion_queue.task_done()
+
+async def reuse_cached_conversion(cache_key: tuple, output_path: str) -> bool:
+    """Hard-link (or clone/copy) an earlier identical conversion's output to output_path; False if there is none"""
+    cached_path = conversion_cache.get(cache_key)
+    if cached_path is None:
+        return False
+    try:
+        os.link(cached_path, output_path)
+    except FileNotFoundError:
+        # The earlier output was deleted with its job
+        conversion_cache.pop(cache_key, None)
+        return False
+    except OSError:
+        # Filesystem without hard links: reflink where supported, else an in-kernel copy, off the event loop
+        await asyncio.to_thread(conversion_service._fast_copy, cached_path, output_path)
+    return True
 
 async def is_file_in_use(file_hash: str, current_job_id: str) -> bool:
     """Check if a file is still being used by other jobs"""
-    for job_id, job in jobs.items():
-        if job_id != current_job_id and job.get("file_hash") == file_hash:
-            return True
-    return False
-
-async def cleanup_unused_files():
-    """Remove files that are no longer referenced by any jobs"""
-    files_to_remove = []
-    
-    for file_hash, file_info in file_hash_mapping.items():
-        is_used = False
-        for job in jobs.values():
-            if job.get("file_hash") == file_hash:
-                is_used = True
-                break
-        
-        if not is_used:
-            files_to_remove.append(file_hash)
-    
-    # Remove unused files
-    for file_hash in files_to_remove:
-        file_info = file_hash_mapping[file_hash]
+    async with jobs_lock:
+        own_reference = 1 if jobs.get(current_job_id, {}).get("file_hash") == file_hash else 0
+        return jobs.hash_refcount[file_hash] > own_reference
+
+# Directory scans and deletes below are blocking, so the async cleanups run them via asyncio.to_thread
+
+def _list_files(directory: str) -> list[str]:
+    """Names of the regular files in a directory, skipping dotfiles (.gitkeep and uploads still being streamed in)"""
+    with os.scandir(directory) as entries:
+        return [entry.name for entry in entries if not entry.name.startswith('.') and entry.is_file()]
+
+def _remove_files(paths: list[str], description: str):
+    """Delete each path, logging failures instead of stopping at the first one"""
+    for path in paths:
         try:
-            if os.path.exists(file_info["upload_path"]):
-                os.remove(file_info["upload_path"])
-            del file_hash_mapping[file_hash]
+            os.remove(path)
+            logging.info(f"Removed {description}: {path}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            print(f"Error removing file {file_info['upload_path']}: {e}")
+            logging.error(f"Error removing {description} {path}: {e}")
+
+async def trim_upload_cache():
+    """Release expired jobs' references, then evict unreferenced uploads beyond UPLOAD_CACHE_MAX_BYTES.
+
+    Unreferenced uploads within the budget stay, so a repeated upload can still reuse them.
+    """
+    async with uploads_lock:
+        async with jobs_lock:
+            jobs.expire()
+            evicted = evict_unused_uploads()
+        await asyncio.to_thread(_remove_files, evicted, "evicted upload")
+
+def _older_than(paths: list[str], seconds: int) -> list[str]:
+    """The paths last modified more than seconds ago (ones already gone are dropped)"""
+    cutoff = time.time() - seconds
+    old = []
+    for path in paths:
+        try:
+            if os.stat(path).st_mtime < cutoff:
+                old.append(path)
+        except FileNotFoundError:
+            pass
+    return old
+
+# Files another worker process has just stored or reused may not be referenced from Redis yet
+ORPHAN_MIN_AGE_SECONDS = 300
+
+async def cleanup_orphaned_files():
+    """Remove uploads and converted outputs no longer referenced by any job (e.g. after job expiry or a restart).
+
+    With REDIS_URL set, the jobs of all worker processes count, not only this one's.
+    """
+    upload_names, converted_names = await asyncio.gather(
+        asyncio.to_thread(_list_files, UPLOAD_DIR),
+        asyncio.to_thread(_list_files, CONVERTED_DIR),
+    )
+    try:
+        shared_job_ids, shared_hashes = await shared_job_references()
+    except Exception as e:
+        logging.error(f"Skipping orphaned file cleanup, job references unavailable from Redis: {e}")
+        return
+    
+    async with uploads_lock:
+        # Live jobs and uploads are read after the scan, so anything created while it ran is kept
+        async with jobs_lock:
+            live_job_ids = set(jobs.keys()) | shared_job_ids
+        known_uploads = {os.path.basename(info["upload_path"]) for info in file_hash_mapping.values()}
+        
+        orphans = [
+            os.path.join(UPLOAD_DIR, name) for name in upload_names
+            if name not in known_uploads and os.path.splitext(name)[0] not in shared_hashes
+        ]
+        # Only job outputs ("<jobId>_output.<ext>"); converters' own intermediates are left alone
+        orphans += [
+            os.path.join(CONVERTED_DIR, name) for name in converted_names
+            if "_output" in name and name.split("_output", 1)[0] not in live_job_ids
+        ]
+        if redis_client is not None:
+            orphans = await asyncio.to_thread(_older_than, orphans, ORPHAN_MIN_AGE_SECONDS)
+        await asyncio.to_thread(_remove_files, orphans, "orphaned file")
 
 def cleanup_temp_files(directory: str):
     """Clean up temporary files (files starting with ~$)"""
     try:
-        for filename in os.listdir(directory):
-            if filename.startswith('~$'):
-                temp_file_path = os.path.join(directory, filename)
-                if os.path.isfile(temp_file_path):
-                    os.remove(temp_file_path)
-                    logging.info(f"Cleaned up temporary file: {filename}")
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith('~$') and entry.is_file():
+                    os.remove(entry.path)
+                    logging.info(f"Cleaned up temporary file: {entry.name}")
     except Exception as e:
         logging.error(f"Error cleaning up temporary files: {e}")
 
-# Initialize scheduler for periodic cleanup
-scheduler = AsyncIOScheduler()
+# How often periodic_cleanup runs scheduled_cleanup
+CLEANUP_INTERVAL_SECONDS = 3600
+cleanup_task = None
 
-@scheduler.scheduled_job(CronTrigger(minute=0))  # Run every hour
 async def scheduled_cleanup():
-    """Scheduled cleanup of temporary files and unused files"""
+    """Scheduled cleanup of temporary and orphaned files (unused uploads are evicted as new ones arrive)"""
     try:
         logging.info("Running scheduled cleanup...")
-        await cleanup_unused_files()
-        cleanup_temp_files(CONVERTED_DIR)
-        cleanup_temp_files(UPLOAD_DIR)
+        await cleanup_orphaned_files()
+        await asyncio.to_thread(cleanup_temp_files, CONVERTED_DIR)
+        await asyncio.to_thread(cleanup_temp_files, UPLOAD_DIR)
         logging.info("Scheduled cleanup completed")
     except Exception as e:
         logging.error(f"Error in scheduled cleanup: {e}")
 
-# Start the scheduler
-scheduler.start()
+async def periodic_cleanup():
+    """Run scheduled_cleanup every CLEANUP_INTERVAL_SECONDS (its blocking file work already runs in threads)"""
+    while True:
+        await asyncio.sleep(CLEANUP_INTERVAL_SECONDS)
+        await scheduled_cleanup()
+
+@app.on_event("startup")
+async def startup_cleanup():
+    """Job state is in memory only, so files left over from a previous run are orphaned"""
+    await cleanup_orphaned_files()
+
+@app.on_event("startup")
+async def start_periodic_cleanup():
+    """Start the hourly cleanup loop"""
+    global cleanup_task
+    cleanup_task = asyncio.create_task(periodic_cleanup())
 
-@app.post("/convert")
-async def convert_file(
-    background_tasks: BackgroundTasks,
-    file: UploadFile = File(...),
-    sourceFormat: str = Form(...),
-    destinationFormat: str = Form(...)
-):
+@app.on_event("startup")
+async def start_conversion_workers():
+    """Start the tasks that drain conversion_queue"""
+    conversion_workers.extend(asyncio.create_task(conversion_worker()) for _ in range(CONVERSION_WORKERS))
+
+# /convert parses its multipart body itself (see receive_upload), so its form is described for OpenAPI by hand
+CONVERT_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "multipart/form-data": {
+            "schema": {
+                "type": "object",
+                "required": ["file", "sourceFormat", "destinationFormat"],
+                "properties": {
+                    "file": {"type": "string", "format": "binary"},
+                    "sourceFormat": {"type": "string"},
+                    "destinationFormat": {"type": "string"},
+                },
+            }
+        }
+    },
+}
+
+@app.post("/convert", openapi_extra={"requestBody": CONVERT_REQUEST_BODY})
+async def convert_file(request: Request, background_tasks: BackgroundTasks):
+    partial_path = None
     try:
+        # Stream the upload to disk and get its hash
+        fields, original_filename, partial_path, file_hash, size = await receive_upload(request)
+        sourceFormat = fields.get("sourceFormat")
+        destinationFormat = fields.get("destinationFormat")
+        if not sourceFormat or not destinationFormat:
+            raise HTTPException(status_code=422, detail="sourceFormat and destinationFormat are required")
+        
         # Validate input formats
         source_format = sourceFormat.upper()
         destination_format = destinationFormat.upper()
@@ -295,12 +920,7 @@ async def convert_file(
             destination_format = "JPG"
         
         # Check if conversion is supported
-        supported_conversion = False
-        for format_info in supported_formats:
-            if format_info["source"] == source_format or (format_info["source"] == "JPEG/JPG" and source_format == "JPG"):
-                if destination_format in format_info["destination"]:
-                    supported_conversion = True
-                    break
+        supported_conversion = destination_format in SUPPORTED.get(source_format, frozenset())
         
         if not supported_conversion:
             raise HTTPException(
@@ -311,52 +931,51 @@ async def convert_file(
         # Generate job ID and file paths
         job_id = str(uuid4())
         
-        # Read file content and get its hash
-        file_content = await file.read()
-        upload_path, file_hash = await get_or_create_file_path(file_content, file.filename)
+        # Store the upload under its hash, or reuse the identical file already stored
+        upload_path = await get_or_create_file_path(partial_path, file_hash, size, original_filename)
+        partial_path = None
         
         # Log whether file was reused or created new
-        if file_hash in file_hash_mapping and any(job.get("file_hash") == file_hash for job in jobs.values()):
+        if await is_file_in_use(file_hash, job_id):
             print(f"Reusing existing file with hash {file_hash[:8]}... for job {job_id}")
         else:
             print(f"Created new file with hash {file_hash[:8]}... for job {job_id}")
         
-        # Determine output file extension
-        output_extension = f".{destination_format.lower()}"
-        if destination_format == "JPG":
-            output_extension = ".jpg"
-        elif destination_format == "DOCX":
-            output_extension = ".docx"
-        elif destination_format == "XLSX":
-            output_extension = ".xlsx"
-        elif destination_format == "PPTX":
-            output_extension = ".pptx"
-        
-        output_filename = f"{job_id}_output{output_extension}"
+        # Output file named after the job, with the destination format's extension
+        output_filename = f"{job_id}_output{output_extension(destination_format)}"
         output_path = os.path.join(CONVERTED_DIR, output_filename)
         
+        # Same content and formats converted before: serve a link to that output instead of converting again
+        cached = await reuse_cached_conversion((file_hash, source_format, destination_format), output_path)
+        
         # Initialize job status
-        jobs[job_id] = {
-            "status": "pending",
-            "progress": 0,
-            "upload_path": upload_path,
-            "converted_path": output_path,
-            "error": None,
-            "source_format": source_format,
-            "destination_format": destination_format,
-            "original_filename": file.filename,
-            "file_hash": file_hash
-        }
+        async with jobs_lock:
+            jobs[job_id] = Job(job_id, {
+                "status": "completed" if cached else "pending",
+                "progress": 100 if cached else 0,
+                "upload_path": upload_path,
+                "converted_path": output_path,
+                "error": None,
+                "source_format": source_format,
+                "destination_format": destination_format,
+                "original_filename": original_filename,
+                "file_hash": file_hash
+            })
+            if cached:
+                jobs[job_id]["conversion_method"] = "cached"
+        await publish_job(job_id, create=True)
         
-        # Start background conversion task
-        background_tasks.add_task(
-            perform_conversion,
+        if cached:
+            return {"jobId": job_id}
+        
+        # Queue the conversion; the job stays "pending" until a worker picks it up
+        conversion_queue.put_nowait((
             job_id,
             upload_path,
             output_path,
             source_format,
             destination_format
-        )
+        ))
         
         # Clean up any temporary files
         background_tasks.add_task(cleanup_temp_files, CONVERTED_DIR)
@@ -367,10 +986,14 @@ async def convert_file(
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
+    finally:
+        # An upload that was received but never stored (e.g. an unsupported conversion)
+        if partial_path is not None and os.path.exists(partial_path):
+            os.remove(partial_path)
 
 @app.get("/status/{jobId}")
-def get_status(jobId: str):
-    job = jobs.get(jobId)
+async def get_status(jobId: str):
+    job = await get_job(jobId)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     resp = {
@@ -383,69 +1006,79 @@ def get_status(jobId: str):
     }
     return resp
 
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header value against etag"""
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in if_none_match.split(","))
+
 @app.get("/download/{jobId}")
-def download_file(jobId: str):
-    job = jobs.get(jobId)
+async def download_file(jobId: str, request: Request):
+    job = await get_job(jobId)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
     if job["status"] != "completed":
         raise HTTPException(status_code=400, detail="File conversion not completed yet")
     
-    if not job["converted_path"] or not os.path.exists(job["converted_path"]):
+    # Same content converted between the same formats is the same download (as for conversion_cache), so clients
+    # that already have it get a 304. Weak, since separate conversions of one input needn't be byte-identical.
+    etag = f'W/"{job["file_hash"][:16]}-{job["source_format"]}-{job["destination_format"]}"'
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    # One stat both checks the file exists and is handed to FileResponse, which would otherwise stat again
+    try:
+        stat_result = os.stat(job["converted_path"]) if job["converted_path"] else None
+    except OSError:
+        stat_result = None
+    if stat_result is None:
         raise HTTPException(status_code=404, detail="Converted file not found")
     
     # Generate a meaningful filename for download
     original_name = job.get("original_filename", "converted_file")
     name_without_ext = os.path.splitext(original_name)[0]
     destination_format = job.get("destination_format", "").lower()
-    
-    if destination_format == "jpg":
-        download_filename = f"{name_without_ext}.jpg"
-    elif destination_format == "docx":
-        download_filename = f"{name_without_ext}.docx"
-    elif destination_format == "xlsx":
-        download_filename = f"{name_without_ext}.xlsx"
-    elif destination_format == "pptx":
-        download_filename = f"{name_without_ext}.pptx"
-    else:
-        download_filename = f"{name_without_ext}.{destination_format}"
+    download_filename = f"{name_without_ext}{output_extension(destination_format)}"
     
     return FileResponse(
         job["converted_path"], 
         filename=download_filename,
-        media_type='application/octet-stream'
+        media_type=MIME_TYPES.get(destination_format, 'application/octet-stream'),
+        stat_result=stat_result,
+        headers={"ETag": etag}
     )
 
 @app.get("/formats")
-def get_formats():
+def get_formats(request: Request):
     """Get all supported conversion formats"""
-    return supported_formats
+    return revalidated(request, FORMATS_RESPONSE)
 
 @app.get("/health")
 def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "message": "Universal File Converter API is running"}
+    return Response(content=HEALTH_JSON, media_type="application/json")
 
 @app.get("/")
-def root():
+def root(request: Request):
     """Root endpoint with API information"""
-    return {
-        "message": "Universal File Converter API",
-        "version": "1.0.0",
-        "endpoints": {
-            "convert": "POST /convert - Convert a file",
-            "status": "GET /status/{jobId} - Check conversion status",
-            "download": "GET /download/{jobId} - Download converted file",
-            "formats": "GET /formats - Get supported formats",
-            "health": "GET /health - Health check"
-        }
-    }
+    return revalidated(request, ROOT_RESPONSE)
 
 @app.delete("/jobs/{jobId}")
-def delete_job(jobId: str):
+async def delete_job(jobId: str):
     """Delete a job and cleanup associated files"""
-    job = jobs.get(jobId)
+    async with jobs_lock:
+        job = jobs.pop(jobId, None)
+    if redis_client is not None:
+        # The job may belong to another worker process
+        if job is None:
+            job = await get_job(jobId)
+        try:
+            await redis_client.delete(f"job:{jobId}")
+        except Exception as e:
+            logging.error(f"Error deleting job {jobId} from Redis: {e}")
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
@@ -456,19 +1089,16 @@ def delete_job(jobId: str):
         except Exception as e:
             print(f"Error removing converted file: {e}")
     
-    # Remove job from tracking
-    del jobs[jobId]
-    
-    # Clean up unused files
-    asyncio.create_task(cleanup_unused_files())
-    
+    # Popping the job released its reference to the upload; evict_unused_uploads decides when that goes
     return {"message": "Job deleted successfully"}
 
 @app.get("/jobs")
-def list_jobs():
+async def list_jobs():
     """List all jobs (for debugging/admin purposes)"""
     job_list = []
-    for job_id, job_data in jobs.items():
+    async with jobs_lock:
+        job_items = list(jobs.items())
+    for job_id, job_data in job_items:
         job_list.append({
             "jobId": job_id,
             "status": job_data["status"],
@@ -484,7 +1114,7 @@ def list_jobs():
 async def trigger_cleanup(background_tasks: BackgroundTasks):
     """Manually trigger cleanup of unused files and temporary files"""
     try:
-        background_tasks.add_task(cleanup_unused_files)
+        background_tasks.add_task(trim_upload_cache)
         background_tasks.add_task(cleanup_temp_files, CONVERTED_DIR)
         background_tasks.add_task(cleanup_temp_files, UPLOAD_DIR)
         return {"message": "Cleanup initiated"}
@@ -493,11 +1123,17 @@ async def trigger_cleanup(background_tasks: BackgroundTasks):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/storage/stats")
-def get_storage_stats():
+async def get_storage_stats():
     """Get storage statistics"""
-    upload_files = len([f for f in os.listdir(UPLOAD_DIR) if os.path.isfile(os.path.join(UPLOAD_DIR, f))])
-    converted_files = len([f for f in os.listdir(CONVERTED_DIR) if os.path.isfile(os.path.join(CONVERTED_DIR, f))])
-    active_jobs = len(jobs)
+    upload_names, converted_names = await asyncio.gather(
+        asyncio.to_thread(_list_files, UPLOAD_DIR),
+        asyncio.to_thread(_list_files, CONVERTED_DIR),
+    )
+    upload_files = len(upload_names)
+    converted_files = len(converted_names)
+    async with jobs_lock:
+        jobs.expire()
+        active_jobs = len(jobs)
     unique_files = len(file_hash_mapping)
     
     return {
@@ -18,6 +18,29 @@ def main():
     os.makedirs("converted", exist_ok=True)
     print("✅ Created upload and conversion directories")
     
+    if os.getenv("RELOAD", "").lower() in ("1", "true", "yes"):
+        run_dev_server()
+    else:
+        run_production_server()
+
+def run_production_server():
+    """Replace this process with gunicorn supervising uvicorn workers (uvloop + httptools)"""
+    # One worker by default: upload ownership, eviction and cleanup of files are still per process, even with Redis
+    workers = os.getenv("WEB_CONCURRENCY", "1")
+    print(f"⚙️  Starting {workers} worker(s) under gunicorn")
+    
+    # --preload imports the app once before forking, so workers share its memory copy-on-write
+    os.execvp("gunicorn", [
+        "gunicorn", "main:app",
+        "-k", "uvicorn.workers.UvicornWorker",
+        "-w", workers,
+        "--bind", "0.0.0.0:8000",
+        "--worker-tmp-dir", "/dev/shm",
+        "--preload"
+    ])
+
+def run_dev_server():
+    """Single process with auto-reload (set RELOAD=1)"""
     try:
         # Start the server
         uvicorn.run(